@@ -1,14 +1,17 @@
+import functools
 import os
 from dataclasses import dataclass
 from typing import List, Optional
 
-from dotenv import load_dotenv
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv is optional; fall back to the process environment
+    pass
+else:
+    load_dotenv()
 
 
-load_dotenv()
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Configuration for the summary Discord bot."""
 
@@ -21,6 +24,15 @@ class Settings:
     gemini_api_key: str = ""
     # Default to the newer google-genai client model you provided
     gemini_model: str = "gemini-2.5-pro"
+    # Upper bound on concurrent blocking Gemini calls
+    gemini_max_workers: int = 4
+    # Summaries are formatted directly unless Gemini is explicitly enabled
+    use_gemini: bool = False
+
+    @property
+    def owner_user_id(self) -> int:
+        """Primary owner ID, kept for code written against the single-owner setting."""
+        return self.owner_user_ids[0] if self.owner_user_ids else 0
 
 
 def _parse_keywords(raw: Optional[str]) -> List[str]:
@@ -47,7 +59,9 @@ def _parse_owner_ids(raw: Optional[str], fallback_single: int) -> List[int]:
     return owner_ids
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Read settings from the environment once per process."""
     token = os.getenv("SUMMARY_DISCORD_TOKEN", "").strip()
     server_id = int(os.getenv("SUMMARY_SERVER_ID", "0") or 0)
     owner_user_id = int(os.getenv("SUMMARY_OWNER_USER_ID", "0") or 0)
@@ -60,6 +74,8 @@ def get_settings() -> Settings:
 
     gemini_key = os.getenv("GEMINI_API_KEY", "").strip()
     gemini_model = os.getenv("GEMINI_MODEL", "gemini-3-pro-preview")
+    gemini_max_workers = int(os.getenv("GEMINI_MAX_WORKERS", "4") or 4)
+    use_gemini = os.getenv("SUMMARY_USE_GEMINI", "").strip().lower() in ("1", "true", "yes")
 
     return Settings(
         discord_token=token,
@@ -69,6 +85,8 @@ def get_settings() -> Settings:
         timezone=tz,
         gemini_api_key=gemini_key,
         gemini_model=gemini_model,
+        gemini_max_workers=gemini_max_workers,
+        use_gemini=use_gemini,
     )
 
 
@@ -1,21 +1,94 @@
+import io
+import mmap
+import os
 import re
 from collections import defaultdict, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple, Set
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Tuple, Set
+
+
+# Precompiled line patterns used by InstagramAutomationAnalyzer.parse_log
+_METHOD_RE = re.compile(r'\(Method (\d+)\)')
+# One alternation per account line kind, tried in priority order from the
+# start of the line:
+#   follows:   "name - total # of follows made: X (... which is N)"
+#   unfollows: "name - total # of unfollows made: X"
+#   blocked:   "name – blocked"
+#   off:       "name – off"
+#   name:      "name" (Method 9 - no metrics listed)
+# The metric phrases are always lowercase in generated logs, so the default
+# pattern matches them case-sensitively; the case-insensitive variant is only
+# tried when a line has a "made:" marker in some other casing.
+def _account_line_re(metric_flags: str) -> re.Pattern:
+    """Compile the account line pattern; metric_flags ('' or 'i') scope the metric phrases."""
+    return re.compile(
+        rf'(?{metric_flags}:(?P<follows>[a-zA-Z0-9._]+)\s*-\s*total\s*#\s*of\s*follows\s*made:\s*(?P<follows_count>\d+))'
+        r'(?:.*?which is (?P<daily_max>\d+))?'
+        rf'|(?{metric_flags}:(?P<unfollows>[a-zA-Z0-9._]+)\s*-\s*total\s*#\s*of\s*unfollows\s*made:\s*(?P<unfollows_count>\d+))'
+        r'|(?=.*–)(?=(?i:.*blocked))(?P<blocked>[^–]*)'
+        r'|(?=.*–)(?=.*off\Z)(?P<off>[^–-]*)'
+        r'|(?P<name>[a-zA-Z0-9._]+)\Z'
+    )
+
+
+_ACCOUNT_LINE_RE = _account_line_re('')
+_ACCOUNT_LINE_ANYCASE_RE = _account_line_re('i')
+
+
+@dataclass(slots=True)
+class Account:
+    """One account line parsed from the log."""
+
+    name: str
+    follows: int = 0
+    unfollows: int = 0
+    daily_max: Optional[int] = None
+    met_max: Optional[bool] = None
+    status: str = 'active'  # "active", "blocked" or "off"
+
 
 class InstagramAutomationAnalyzer:
     """
     Analyzes raw Instagram automation logs for 60-device farm.
     Performs line-by-line summation, identifies errors, and generates Discord reports.
+    
+    The public attributes are read-only after parsing: the aggregates are only
+    recomputed after parse_log/parse_lines/set_excluded_phones change the data,
+    so edit phones, accounts or excluded_phones through those methods.
     """
     
+    __slots__ = (
+        'phones',
+        'total_follows',
+        'total_unfollows',
+        'active_phones',
+        'method_1_count',
+        'method_9_count',
+        'active_phone_nums',
+        'failed_accounts',
+        'failed_by_type',
+        'failed_by_phone',
+        'excluded_phones',
+        '_current_phone_data',
+        '_dirty',
+    )
+    
     def __init__(self):
         self.phones = {}  # {phone_number: phone_data}
         self.total_follows = 0
         self.total_unfollows = 0
         self.active_phones = 0
+        self.method_1_count = 0
+        self.method_9_count = 0
+        self.active_phone_nums = []  # completed phones, ascending
         self.failed_accounts = []
+        self.failed_by_type = defaultdict(list)  # {error_type: [failure, ...]}
+        self.failed_by_phone = defaultdict(list)  # {phone_number: [failure, ...]}
         self.excluded_phones = set()
+        self._current_phone_data = None  # phone record that account lines attach to
+        self._dirty = True  # parsed data changed since the last _recompute_all
     
     def parse_log(self, raw_text: str) -> None:
         """
@@ -23,163 +96,151 @@ class InstagramAutomationAnalyzer:
         Handles multi-line format with phones and accounts.
         Supports both data.txt format and summary bot output format (with '   * ' prefix).
         """
-        lines = raw_text.strip().split('\n')
-        current_phone = None
-        current_method = None
-        
+        self.parse_lines(raw_text.splitlines())
+    
+    def parse_lines(self, lines: Iterable[str]) -> None:
+        """
+        Parse log lines one at a time (see parse_log).
+        Lines may keep their trailing newline, so files can be streamed without
+        loading the whole log into one string.
+        """
+        self._current_phone_data = None
+        parse_line = self._parse_line
         for line in lines:
-            # Remove summary bot format prefix if present ('   * ' or '   *')
-            # Check BEFORE stripping to preserve the prefix
-            original_line = line
-            if line.startswith('   * '):
-                line_stripped = line[5:].strip()
-            elif line.startswith('   *'):
-                line_stripped = line[4:].strip()
-            else:
-                line_stripped = line.strip()
-            
-            # Match phone header: "Phone X – status"
-            phone_match = re.match(r'Phone (\d+)\s*–\s*(.+)', line_stripped)
-            if phone_match:
-                phone_num = int(phone_match.group(1))
-                status = phone_match.group(2).strip()
-                
-                current_phone = phone_num
-                current_method = None
-                
-                # Extract method if present
-                method_match = re.search(r'\(Method (\d+)\)', status)
-                if method_match:
-                    current_method = int(method_match.group(1))
-                
-                self.phones[phone_num] = {
-                    'number': phone_num,
-                    'status': status,
-                    'method': current_method,
-                    'accounts': [],
-                    'no_task_made': 'no daily task made' in status.lower(),
-                    'completed': 'completed daily task' in status.lower()
-                }
-                continue
+            parse_line(line)
+    
+    def _parse_line(self, line: str) -> None:
+        """Parse a single log line, updating the current phone state."""
+        # Remove summary bot format prefix if present ('   * ' or '   *')
+        # Check BEFORE stripping to preserve the prefix
+        if line[:5] == '   * ':
+            line_stripped = line[5:].strip()
+        elif line[:4] == '   *':
+            line_stripped = line[4:].strip()
+        else:
+            line_stripped = line.strip()
+        
+        # Match phone header: "Phone X – status" (plain string ops, no regex)
+        if line_stripped[:6] == 'Phone ':
+            head, separator, status = line_stripped.partition('–')
+            phone_digits = head[6:].rstrip()
+            if separator and status and phone_digits.isdecimal():
+                self._start_phone(int(phone_digits), status.strip())
+                return
+        
+        # Skip empty lines
+        if not line_stripped:
+            return
+        
+        # Match account lines (only if we have a current phone)
+        current_phone_data = self._current_phone_data
+        if current_phone_data is None:
+            return
+        
+        account_match = _ACCOUNT_LINE_RE.match(line_stripped)
+        is_metrics_line = account_match is not None and (
+            account_match.group('follows') is not None
+            or account_match.group('unfollows') is not None
+        )
+        if not is_metrics_line and 'made:' in line_stripped.lower():
+            # Metric phrase in non-standard casing - re-match case-insensitively
+            account_match = _ACCOUNT_LINE_ANYCASE_RE.match(line_stripped)
+        if not account_match:
+            return
+        
+        # Account with metrics: "account_name - total # of follows made: X (met/didn't met...)"
+        account_name = account_match.group('follows')
+        if account_name is not None:
+            follows_count = int(account_match.group('follows_count'))
+            # Check for "met the daily max" but NOT "didn't met the daily max"
+            met_max = 'met the daily max' in line_stripped and "didn't" not in line_stripped
+            daily_max = account_match.group('daily_max')
+            daily_max = int(daily_max) if daily_max else None
             
-            # Skip empty lines
-            if not line_stripped:
-                continue
+            self._add_account(current_phone_data, Account(
+                name=account_name,
+                follows=follows_count,
+                daily_max=daily_max,
+                met_max=met_max,
+            ))
+            return
+        
+        # Unfollows: "account_name - total # of unfollows made: X"
+        account_name = account_match.group('unfollows')
+        if account_name is not None:
+            unfollows_count = int(account_match.group('unfollows_count'))
             
-            # Match account lines (only if we have a current phone)
-            if current_phone is not None:
-                # Account with metrics: "account_name - total # of follows made: X (met/didn't met...)"
-                follows_match = re.match(
-                    r'([a-zA-Z0-9._]+)\s*-\s*total\s*#\s*of\s*follows\s*made:\s*(\d+)',
-                    line_stripped,
-                    re.IGNORECASE
-                )
-                if follows_match:
-                    account_name = follows_match.group(1)
-                    follows_count = int(follows_match.group(2))
-                    # Check for "met the daily max" but NOT "didn't met the daily max"
-                    met_max = 'met the daily max' in line_stripped and "didn't" not in line_stripped
-                    max_match = re.search(r'which is (\d+)', line_stripped)
-                    daily_max = int(max_match.group(1)) if max_match else None
-                    
-                    self.phones[current_phone]['accounts'].append({
-                        'name': account_name,
-                        'follows': follows_count,
-                        'unfollows': 0,
-                        'daily_max': daily_max,
-                        'met_max': met_max,
-                        'status': 'active'
-                    })
-                    continue
-                
-                # Unfollows: "account_name - total # of unfollows made: X"
-                unfollows_match = re.match(
-                    r'([a-zA-Z0-9._]+)\s*-\s*total\s*#\s*of\s*unfollows\s*made:\s*(\d+)',
-                    line_stripped,
-                    re.IGNORECASE
-                )
-                if unfollows_match:
-                    account_name = unfollows_match.group(1)
-                    unfollows_count = int(unfollows_match.group(2))
-                    
-                    # Find existing account or add new
-                    found = False
-                    for account in self.phones[current_phone]['accounts']:
-                        if account['name'] == account_name:
-                            account['unfollows'] = unfollows_count
-                            found = True
-                            break
-                    if not found:
-                        self.phones[current_phone]['accounts'].append({
-                            'name': account_name,
-                            'follows': 0,
-                            'unfollows': unfollows_count,
-                            'daily_max': None,
-                            'met_max': None,
-                            'status': 'active'
-                        })
-                    continue
-                
-                # Blocked account: "account_name – blocked"
-                if '–' in line_stripped and 'blocked' in line_stripped.lower():
-                    account_name = line_stripped.split('–')[0].strip()
-                    self.phones[current_phone]['accounts'].append({
-                        'name': account_name,
-                        'follows': 0,
-                        'unfollows': 0,
-                        'daily_max': None,
-                        'met_max': None,
-                        'status': 'blocked'
-                    })
-                    continue
-                
-                # Offline account: "account_name – off"
-                if '–' in line_stripped and line_stripped.endswith('off'):
-                    account_name = line_stripped.replace('–', '-').split('-')[0].strip()
-                    self.phones[current_phone]['accounts'].append({
-                        'name': account_name,
-                        'follows': 0,
-                        'unfollows': 0,
-                        'daily_max': None,
-                        'met_max': None,
-                        'status': 'off'
-                    })
-                    continue
-                
-                # Account name only (Method 9 - warmup/story viewing, no metrics listed)
-                if re.match(r'^[a-zA-Z0-9._]+$', line_stripped):
-                    # Check if this isn't a header or other pattern
-                    if not any(skip in line_stripped for skip in ['Phone', 'Daily', 'Summary']):
-                        self.phones[current_phone]['accounts'].append({
-                            'name': line_stripped,
-                            'follows': 0,
-                            'unfollows': 0,
-                            'daily_max': None,
-                            'met_max': None,
-                            'status': 'active'
-                        })
+            # Find existing account or add new
+            existing = current_phone_data['accounts_by_name'].get(account_name)
+            if existing is not None:
+                existing.unfollows = unfollows_count
+                self._dirty = True
+            else:
+                self._add_account(current_phone_data, Account(
+                    name=account_name,
+                    unfollows=unfollows_count,
+                ))
+            return
+        
+        # Blocked account: "account_name – blocked"
+        account_name = account_match.group('blocked')
+        if account_name is not None:
+            self._add_account(current_phone_data, Account(
+                name=account_name.strip(),
+                status='blocked',
+            ))
+            return
+        
+        # Offline account: "account_name – off"
+        account_name = account_match.group('off')
+        if account_name is not None:
+            self._add_account(current_phone_data, Account(
+                name=account_name.strip(),
+                status='off',
+            ))
+            return
+        
+        # Account name only (Method 9 - warmup/story viewing, no metrics listed)
+        # Check if this isn't a header or other pattern
+        if not any(skip in line_stripped for skip in ['Phone', 'Daily', 'Summary']):
+            self._add_account(current_phone_data, Account(name=line_stripped))
+    
+    def _start_phone(self, phone_num: int, status: str) -> None:
+        """Create the record for a phone header and make it the current phone."""
+        # Extract method if present
+        current_method = None
+        method_match = _METHOD_RE.search(status)
+        if method_match:
+            current_method = int(method_match.group(1))
+        
+        status_lower = status.lower()
+        self._current_phone_data = self.phones[phone_num] = {
+            'number': phone_num,
+            'status': status,
+            'method': current_method,
+            'accounts': [],
+            'accounts_by_name': {},  # {account_name: account} for O(1) lookups
+            'no_task_made': 'no daily task made' in status_lower,
+            'completed': 'completed daily task' in status_lower
+        }
+        self._dirty = True
+    
+    def _add_account(self, phone_data: Dict, account: Account) -> None:
+        """
+        Append an account to a phone and index it by name.
+        The first account with a given name wins, matching a front-to-back scan.
+        """
+        phone_data['accounts'].append(account)
+        phone_data['accounts_by_name'].setdefault(account.name, account)
+        self._dirty = True
     
     def calculate_totals(self) -> None:
         """
         Line-by-line summation for 100% accuracy.
         Sum all follows and unfollows across all active accounts.
         """
-        self.total_follows = 0
-        self.total_unfollows = 0
-        self.active_phones = 0
-        
-        for phone_num in sorted(self.phones.keys()):
-            phone_data = self.phones[phone_num]
-            
-            # Only count phones with completed tasks or Method 9
-            if phone_data['completed']:
-                self.active_phones += 1
-                
-                # Line-by-line sum
-                for account in phone_data['accounts']:
-                    if account['status'] != 'off':
-                        self.total_follows += account['follows']
-                        self.total_unfollows += account['unfollows']
+        if self._dirty:
+            self._recompute_all()
     
     def identify_errors(self) -> None:
         """
@@ -187,34 +248,69 @@ class InstagramAutomationAnalyzer:
         Only report phones that completed tasks but had errors.
         Skip "no daily task made" phones.
         """
+        if self._dirty:
+            self._recompute_all()
+    
+    def _recompute_all(self) -> None:
+        """
+        Single pass over the parsed phones that refreshes the totals, the failure
+        indices and the per-method phone counts consumed by the report builders.
+        """
+        total_follows = 0
+        total_unfollows = 0
+        method_1_count = 0
+        method_9_count = 0
+        active_phone_nums = []
         self.failed_accounts = []
+        self.failed_by_type = defaultdict(list)
+        self.failed_by_phone = defaultdict(list)
         
-        for phone_num in sorted(self.phones.keys()):
-            # Skip excluded phones (21-25 or user-specified)
-            if phone_num in self.excluded_phones:
+        for phone_num, phone_data in sorted(self.phones.items()):
+            # Only count phones with completed tasks or Method 9
+            if not phone_data['completed']:
                 continue
             
-            phone_data = self.phones[phone_num]
+            active_phone_nums.append(phone_num)
+            if phone_data['method'] == 1:
+                method_1_count += 1
+            elif phone_data['method'] == 9:
+                method_9_count += 1
             
-            # Skip phones with "no daily task made" - don't report them as errors
-            if phone_data['no_task_made']:
-                continue
+            # Skip excluded phones (21-25 or user-specified) and phones with
+            # "no daily task made" - don't report them as errors
+            report_errors = phone_num not in self.excluded_phones and not phone_data['no_task_made']
             
-            # Check for accounts that didn't meet daily max (only for completed tasks)
-            if phone_data['completed']:
-                for account in phone_data['accounts']:
-                    # Skip offline accounts
-                    if account['status'] == 'off':
-                        continue
-                    
-                    # Performance issue: didn't meet daily max (regardless of follow count)
-                    if account['daily_max'] is not None and not account['met_max']:
-                        self.failed_accounts.append({
-                            'phone': phone_num,
-                            'account': account['name'],
-                            'error_type': 'Performance',
-                            'reason': f"Failed to meet daily max of {account['daily_max']}"
-                        })
+            for account in phone_data['accounts']:
+                # Skip offline accounts
+                if account.status == 'off':
+                    continue
+                
+                # Line-by-line sum
+                total_follows += account.follows
+                total_unfollows += account.unfollows
+                
+                # Performance issue: didn't meet daily max (regardless of follow count)
+                if report_errors and account.daily_max is not None and not account.met_max:
+                    self._add_failure({
+                        'phone': phone_num,
+                        'account': account.name,
+                        'error_type': 'Performance',
+                        'reason': f"Failed to meet daily max of {account.daily_max}"
+                    })
+        
+        self.total_follows = total_follows
+        self.total_unfollows = total_unfollows
+        self.active_phones = len(active_phone_nums)
+        self.method_1_count = method_1_count
+        self.method_9_count = method_9_count
+        self.active_phone_nums = active_phone_nums
+        self._dirty = False
+    
+    def _add_failure(self, failure: Dict) -> None:
+        """Record a failed account and index it by error type and phone."""
+        self.failed_accounts.append(failure)
+        self.failed_by_type[failure['error_type']].append(failure)
+        self.failed_by_phone[failure['phone']].append(failure)
     
     def get_success_rate(self) -> float:
         """Calculate success rate based on active phones and failed tasks."""
@@ -227,47 +323,46 @@ class InstagramAutomationAnalyzer:
         """
         Generate Discord-formatted summary report.
         """
-        summary = []
-        summary.append("📊 *INSTAGRAM AUTOMATION FARM ANALYSIS*")
-        summary.append(f"📅 *Date:* December 31, 2025")
-        summary.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("📊 *INSTAGRAM AUTOMATION FARM ANALYSIS*\n")
+        w(f"📅 *Date:* December 31, 2025\n")
+        w("\n")
         
         # Device Activity Summary
-        summary.append("═══════════════════════════════════════")
-        summary.append("📈 *DEVICE ACTIVITY SUMMARY*")
-        summary.append("═══════════════════════════════════════")
-        summary.append(f"✅ *Total Follows Made:* {self.total_follows:,}")
-        summary.append(f"❌ *Total Unfollows Made:* {self.total_unfollows:,}")
-        summary.append(f"📱 *Active Devices:* {self.active_phones}/60")
-        summary.append(f"📊 *Success Rate:* {self.get_success_rate():.1f}%")
-        summary.append("")
+        w("═══════════════════════════════════════\n")
+        w("📈 *DEVICE ACTIVITY SUMMARY*\n")
+        w("═══════════════════════════════════════\n")
+        w(f"✅ *Total Follows Made:* {self.total_follows:,}\n")
+        w(f"❌ *Total Unfollows Made:* {self.total_unfollows:,}\n")
+        w(f"📱 *Active Devices:* {self.active_phones}/60\n")
+        w(f"📊 *Success Rate:* {self.get_success_rate():.1f}%\n")
+        w("\n")
         
         # Issues & Status Reasons
         if self.failed_accounts:
-            summary.append("═══════════════════════════════════════")
-            summary.append("⚠️ *FAILED ACCOUNTS & ERROR ANALYSIS*")
-            summary.append("═══════════════════════════════════════")
+            w("═══════════════════════════════════════\n")
+            w("⚠️ *FAILED ACCOUNTS & ERROR ANALYSIS*\n")
+            w("═══════════════════════════════════════\n")
             
-            # Group by error type
-            errors_by_type = defaultdict(list)
-            for error in self.failed_accounts:
-                errors_by_type[error['error_type']].append(error)
+            # Grouped by error type in _recompute_all
+            errors_by_type = self.failed_by_type
             
             error_num = 1
             for error_type in ['Configuration', 'Targeting', 'System', 'Performance']:
                 if error_type in errors_by_type:
-                    summary.append(f"\n*{error_type} Errors:*")
+                    w(f"\n*{error_type} Errors:*\n")
                     for error in errors_by_type[error_type]:
-                        summary.append(f"  {error_num}. *Phone {error['phone']}* ({error['account']})")
-                        summary.append(f"     └─ {error['reason']}")
+                        w(f"  {error_num}. *Phone {error['phone']}* ({error['account']})\n")
+                        w(f"     └─ {error['reason']}\n")
                         error_num += 1
         else:
-            summary.append("✅ *No critical errors detected!*")
+            w("✅ *No critical errors detected!*\n")
         
-        summary.append("")
-        summary.append("═══════════════════════════════════════")
+        w("\n")
+        w("═══════════════════════════════════════\n")
         
-        return "\n".join(summary)
+        return buf.getvalue()[:-1]  # drop the trailing newline
     
     def generate_custom_format(self, date_str: str = None) -> str:
         """
@@ -276,75 +371,68 @@ class InstagramAutomationAnalyzer:
         Args:
             date_str: Optional date string to use in the report (e.g., "December 31, 2025")
         """
-        report = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Device Activity Summary
         if date_str:
-            report.append(f"**📊 Device Activity Summary: {date_str}**")
+            w(f"**📊 Device Activity Summary: {date_str}**\n")
         else:
             # Fallback to current date if not provided
             from datetime import datetime
-            report.append(f"**📊 Device Activity Summary: {datetime.now().strftime('%B %d, %Y')}**")
-        
-        report.append(f"Total Follows Executed: **{self.total_follows:,}**")
-        report.append(f"Total Unfollows Executed: **{self.total_unfollows:,}**")
+            w(f"**📊 Device Activity Summary: {datetime.now().strftime('%B %d, %Y')}**\n")
         
-        # Count active phones by method
-        method_1_count = 0
-        method_9_count = 0
-        active_phone_nums = []
-        for phone_data in self.phones.values():
-            if phone_data['completed']:
-                if phone_data['method'] == 1:
-                    method_1_count += 1
-                elif phone_data['method'] == 9:
-                    method_9_count += 1
-                active_phone_nums.append(phone_data['number'])
+        w(f"Total Follows Executed: **{self.total_follows:,}**\n")
+        w(f"Total Unfollows Executed: **{self.total_unfollows:,}**\n")
         
-        report.append(f"Active Phones: **{self.active_phones}/60** ({method_1_count} Using Method 1, {method_9_count} Using Method 9)")
+        # Active phones by method (counted in _recompute_all)
+        w(f"Active Phones: **{self.active_phones}/60** ({self.method_1_count} Using Method 1, {self.method_9_count} Using Method 9)\n")
         
         # Get inactive phones
-        inactive_phones = [p for p in range(1, 61) if p not in active_phone_nums]
+        active_phone_set = set(self.active_phone_nums)
+        inactive_phones = [p for p in range(1, 61) if p not in active_phone_set]
         if inactive_phones:
             inactive_str = self._format_phone_ranges(inactive_phones)
-            report.append(f"Inactive Phones: {inactive_str}")
+            w(f"Inactive Phones: {inactive_str}\n")
         
-        report.append("")
+        w("\n")
         
         # Performance Stats
-        report.append("**:bar_chart: Automation Performance Stats**")
-        report.append("**Scope:** Active Phones")
+        w("**:bar_chart: Automation Performance Stats**\n")
+        w("**Scope:** Active Phones\n")
         
-        successful_phones = self.active_phones - len(set(f['phone'] for f in self.failed_accounts if 'phone' in f))
+        # Distinct phones with at least one failed account (computed once, reused below)
+        failed_phone_set = {f['phone'] for f in self.failed_accounts}
+        failed_phone_count = len(failed_phone_set)
+        
+        successful_phones = self.active_phones - failed_phone_count
         percent_met = (successful_phones / self.active_phones * 100) if self.active_phones > 0 else 0
-        percent_issues = (len(set(f['phone'] for f in self.failed_accounts)) / self.active_phones * 100) if self.active_phones > 0 else 0
+        percent_issues = (failed_phone_count / self.active_phones * 100) if self.active_phones > 0 else 0
         
-        report.append(f"• **% of Phones Met Daily Max:** {percent_met:.1f}% ({successful_phones}/{self.active_phones} phones)")
-        report.append(f"• **% of Phones with Issues:** {percent_issues:.1f}% ({len(set(f['phone'] for f in self.failed_accounts))}/{self.active_phones} phones)")
+        w(f"• **% of Phones Met Daily Max:** {percent_met:.1f}% ({successful_phones}/{self.active_phones} phones)\n")
+        w(f"• **% of Phones with Issues:** {percent_issues:.1f}% ({failed_phone_count}/{self.active_phones} phones)\n")
         
         # Failed phone numbers
-        failed_phones = sorted(set(f['phone'] for f in self.failed_accounts))
+        failed_phones = sorted(failed_phone_set)
         if failed_phones:
             phones_str = ", ".join(str(p) for p in failed_phones)
-            report.append(f"  (Phones {phones_str})")
-        report.append("")
+            w(f"  (Phones {phones_str})\n")
+        w("\n")
         
         # Issue & Status Reasons
-        report.append("**:memo: Issue & Status Reasons**")
+        w("**:memo: Issue & Status Reasons**\n")
         
         if self.failed_accounts:
-            errors_by_phone = defaultdict(list)
-            for error in self.failed_accounts:
-                errors_by_phone[error['phone']].append(error)
+            errors_by_phone = self.failed_by_phone
             
             for phone_num in sorted(errors_by_phone.keys()):
                 for error in errors_by_phone[phone_num]:
-                    report.append(f"**Phone {phone_num}** ({error['account']})")
-                    report.append(f"  └─ **{error['error_type']} Error:** {error['reason']}")
+                    w(f"**Phone {phone_num}** ({error['account']})\n")
+                    w(f"  └─ **{error['error_type']} Error:** {error['reason']}\n")
         else:
-            report.append("✅ **No issues detected!**")
+            w("✅ **No issues detected!**\n")
         
-        return "\n".join(report)
+        return buf.getvalue()[:-1]  # drop the trailing newline
     
     def _format_phone_ranges(self, phones: List[int]) -> str:
         """
@@ -353,27 +441,14 @@ class InstagramAutomationAnalyzer:
         if not phones:
             return ""
         
-        phones = sorted(set(phones))
         ranges = []
-        start = phones[0]
-        end = phones[0]
-        
-        for phone in phones[1:]:
-            if phone == end + 1:
-                end = phone
+        # Consecutive numbers share the same (value - position) key
+        for _, group in groupby(enumerate(sorted(set(phones))), key=lambda ix: ix[1] - ix[0]):
+            run = [phone for _, phone in group]
+            if len(run) == 1:
+                ranges.append(str(run[0]))
             else:
-                if start == end:
-                    ranges.append(str(start))
-                else:
-                    ranges.append(f"{start}-{end}")
-                start = phone
-                end = phone
-        
-        # Add the last range
-        if start == end:
-            ranges.append(str(start))
-        else:
-            ranges.append(f"{start}-{end}")
+                ranges.append(f"{run[0]}-{run[-1]}")
         
         return ", ".join(ranges)
     
@@ -381,9 +456,10 @@ class InstagramAutomationAnalyzer:
         """
         Generate line-by-line calculation breakdown for verification.
         """
-        breakdown = []
-        breakdown.append("📋 *LINE-BY-LINE CALCULATION BREAKDOWN*")
-        breakdown.append("═══════════════════════════════════════\n")
+        buf = io.StringIO()
+        w = buf.write
+        w("📋 *LINE-BY-LINE CALCULATION BREAKDOWN*\n")
+        w("═══════════════════════════════════════\n\n")
         
         running_total = 0
         account_count = 0
@@ -394,32 +470,33 @@ class InstagramAutomationAnalyzer:
             if not phone_data['completed']:
                 continue
             
-            breakdown.append(f"*Phone {phone_num}* (Method {phone_data['method']}):")
+            w(f"*Phone {phone_num}* (Method {phone_data['method']}):\n")
             
             for account in phone_data['accounts']:
-                if account['status'] == 'off':
+                if account.status == 'off':
                     continue
                 
                 account_count += 1
-                running_total += account['follows']
+                running_total += account.follows
                 
-                status_indicator = "✅" if account['met_max'] else "❌"
-                breakdown.append(
-                    f"  {account_count}. {account['name']}: {account['follows']:>3} follows "
-                    f"(max: {account['daily_max']}) {status_indicator} | Running Total: {running_total:,}"
+                status_indicator = "✅" if account.met_max else "❌"
+                w(
+                    f"  {account_count}. {account.name}: {account.follows:>3} follows "
+                    f"(max: {account.daily_max}) {status_indicator} | Running Total: {running_total:,}\n"
                 )
             
-            breakdown.append("")
+            w("\n")
         
-        breakdown.append(f"\n*FINAL TOTAL: {running_total:,} follows*")
+        w(f"\n*FINAL TOTAL: {running_total:,} follows*\n")
         
-        return "\n".join(breakdown)
+        return buf.getvalue()[:-1]  # drop the trailing newline
     
     def set_excluded_phones(self, phone_range: List[int]) -> None:
         """
         Set phones to exclude from error reports (e.g., [21, 22, 23, 24, 25]).
         """
         self.excluded_phones = set(phone_range)
+        self._dirty = True
     
     def generate_full_report(self) -> str:
         """Generate complete report with summary and breakdown."""
@@ -447,18 +524,19 @@ def analyze_from_file(data_file: str = "data.txt", date_str: str = None) -> str:
         Formatted analysis report string, or empty string if error
     """
     try:
-        # Read from file
-        with open(data_file, 'r', encoding='utf-8') as f:
-            raw_text = f.read()
-        
         # Initialize analyzer
         analyzer = InstagramAutomationAnalyzer()
         
         # Optional: Set excluded phones if needed
         # analyzer.set_excluded_phones([21, 22, 23, 24, 25])
         
-        # Parse the log data
-        analyzer.parse_log(raw_text)
+        # Parse the log data straight from a memory map, decoding line by line
+        with open(data_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    analyzer.parse_lines(
+                        raw_line.decode('utf-8') for raw_line in iter(mm.readline, b'')
+                    )
         
         # Generate and return the custom formatted report
         analyzer.calculate_totals()
@@ -1,12 +1,18 @@
 import asyncio
+import bisect
 import datetime
+import functools
+import itertools
 import logging
+import operator
 import re
+import sys
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import discord
-from discord.abc import Messageable
+from discord.abc import GuildChannel, Messageable
 from discord.ext import commands, tasks
 import pytz
 
@@ -30,10 +36,116 @@ intents.messages = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 
 
+# Precompiled patterns for the schedule / Final Update parsers
+_RE_START_TIME = re.compile(r"start\s*time:\s*(\d{4}-\d{2}-\d{2})", re.IGNORECASE)
+_RE_RUN_TIME = re.compile(
+    r"(?:(?P<start>start)|end)\s*time:\s*(?P<date>\d{4}-\d{2}-\d{2})", re.IGNORECASE
+)
+_RE_TASK_FINAL = re.compile(r"task\s+final\s+update", re.IGNORECASE)
+_RE_SCHEDULE_DEVICE = re.compile(
+    r"(?:weekly plan scheduled|task):\s*(.+?)(?:\n|$|\s{2,}|\s*📅)", re.IGNORECASE
+)
+# Day sections - handle multiple formats:
+# Format 1: "📅 Tue Dec 02 18:22:" or "📅\nTue Dec 02 18:22:"
+# Format 2: "Tue Dec 02 18:22:" (no emoji, from text extraction)
+# Pattern captures the day string like "Tue Dec 02"; the section content is
+# the text between one header and the next (see _split_day_sections).
+_RE_DAY_ANCHOR = re.compile(
+    r"(?:📅\s*\n?\s*)?(\w{3}\s+\w{3}\s+\d{1,2})\s+[\d:]+\s*:", re.IGNORECASE
+)
+_RE_ACCOUNTS_SECTION = re.compile(r"Accounts:\s*(.*?)(?:$)", re.DOTALL | re.IGNORECASE)
+# Instagram usernames are ASCII, so the account patterns use re.ASCII to keep
+# \d and \s on the small ASCII classes. The username itself is matched with
+# Unicode \w so a non-ASCII name is captured whole and then dropped by the
+# parsers; ASCII \w would cut it down to a bogus account ("józef" -> "zef").
+_USERNAME = r"(?u:\w+(?:\.\w+)?)"
+_RE_ACCOUNT_LINE = re.compile(
+    rf"({_USERNAME})\s*:\s*(Method\s*\d+|Off)(?:,\s*(\d+)\s*follows)?",
+    re.IGNORECASE | re.ASCII,
+)
+_RE_DEVICE_NAME = re.compile(r"device name:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_RE_ACCOUNT_ALT = re.compile(rf"account:\s*({_USERNAME})", re.IGNORECASE | re.ASCII)
+# Final update section separators and per-account fields in one pattern that
+# finditer walks once. The username fields consume only their label, so a
+# following field (e.g. "Account: account username: x") is still reported.
+_RE_FINAL_FIELDS = re.compile(
+    r"(?P<sep>-{5,})"
+    rf"|account username:(?=\s*(?P<user>{_USERNAME}))"
+    rf"|account:(?=\s*(?P<alt>{_USERNAME}))"
+    r"|no\.\s*of\s*follow\s*made:\s*(?P<follows>\d+)"
+    r"|no\.\s*of\s*unfollowed\s*accounts:\s*(?P<unfollows>\d+)"
+    r"|no\.\s*of\s*follow\s*requests\s*made:\s*(?P<requests>\d+)"
+    r"|account actions blocked:\s*(?P<blocked>true|false)",
+    re.IGNORECASE | re.ASCII,
+)
+_RE_REQUESTS_FALLBACK = re.compile(
+    r"no\.\s*of\s*follow\s*requests:.*\+\s*(\d+)\s*others", re.IGNORECASE
+)
+_RE_PHONE_NORMALIZE = re.compile(r"phone\s*(\d+)", re.IGNORECASE)
+_RE_CHANNEL_PHONE = re.compile(r"phone-?(\d+)", re.IGNORECASE)
+# Summary channel names: start with "phone-" and contain no "test" in any case
+_RE_PHONE_CHANNEL = re.compile(r"phone-(?!(?is:.*test))")
+_RE_AUTOMATION_TYPE = re.compile(r"automation type:\s*(method\s*\d+)", re.IGNORECASE)
+# Field labels that the account patterns can mistake for usernames
+_SCHEDULE_SKIP_NAMES = frozenset({"type", "method", "automation", "stats", "device", "notification"})
+_FINAL_UPDATE_SKIP_NAMES = _SCHEDULE_SKIP_NAMES | {"name"}
+
+
 def _now_utc() -> datetime.datetime:
     return datetime.datetime.now(datetime.timezone.utc)
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_ymd(date_str: str) -> datetime.datetime:
+    """
+    Parse a YYYY-MM-DD date, memoized: the same target and run dates are parsed
+    for every channel. Raises ValueError like strptime.
+    """
+    # strptime rather than date.fromisoformat: targets like "2025-1-5" are accepted
+    return datetime.datetime.strptime(date_str, "%Y-%m-%d")
+
+
+# Lookup tables for parse_day_argument
+_DAY_NAMES = {
+    "monday": 0, "mon": 0, "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2, "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4, "saturday": 5, "sat": 5, "sunday": 6, "sun": 6,
+}
+_MONTH_NAMES = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+
+
+def _split_leading_digits(text: str, max_digits: int) -> Tuple[str, str]:
+    """Split up to ``max_digits`` leading decimal digits off ``text``."""
+    end = 0
+    while end < max_digits and end < len(text) and text[end].isdecimal():
+        end += 1
+    return text[:end], text[end:]
+
+
+def _first_digit_run(text: str) -> Optional[str]:
+    """First run of decimal digits in ``text`` (e.g. "3" in "Phone 3"), or None."""
+    for start, ch in enumerate(text):
+        if ch.isdecimal():
+            return _split_leading_digits(text[start:], len(text))[0]
+    return None
+
+
+def _past_date(today: datetime.date, month: int, day: int) -> Optional[str]:
+    """Most recent month/day on or before today (this year or last), or None if invalid."""
+    try:
+        target_date = datetime.date(today.year, month, day)
+        if target_date > today:
+            target_date = datetime.date(today.year - 1, month, day)
+        return target_date.strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 def parse_day_argument(day_arg: str, timezone: str = "Asia/Karachi") -> Optional[str]:
     """
     Parse day argument into a date string (YYYY-MM-DD).
@@ -53,14 +165,8 @@ def parse_day_argument(day_arg: str, timezone: str = "Asia/Karachi") -> Optional
         return (today - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
 
     # Handle day names
-    day_names = {
-        "monday": 0, "mon": 0, "tuesday": 1, "tue": 1, "tues": 1,
-        "wednesday": 2, "wed": 2, "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
-        "friday": 4, "fri": 4, "saturday": 5, "sat": 5, "sunday": 6, "sun": 6,
-    }
-
-    if day_arg_lower in day_names:
-        target_weekday = day_names[day_arg_lower]
+    target_weekday = _DAY_NAMES.get(day_arg_lower)
+    if target_weekday is not None:
         current_weekday = today.weekday()
         days_ago = (current_weekday - target_weekday) % 7
         if days_ago == 0:
@@ -69,53 +175,47 @@ def parse_day_argument(day_arg: str, timezone: str = "Asia/Karachi") -> Optional
         return target_date.strftime("%Y-%m-%d")
 
     # Handle "dec 02", "december 2"
-    month_names = {
-        "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
-        "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
-        "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9,
-        "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
-    }
-
-    month_day_match = re.match(r"(\w+)\s+(\d{1,2})", day_arg_lower)
-    if month_day_match:
-        month_str, day_str = month_day_match.groups()
-        if month_str in month_names:
-            month, day = month_names[month_str], int(day_str)
-            year = today.year
-            try:
-                target_date = datetime.date(year, month, day)
-                if target_date > today:
-                    target_date = datetime.date(year - 1, month, day)
-                return target_date.strftime("%Y-%m-%d")
-            except ValueError:
-                return None
+    if day_arg_lower[:1].isalpha():
+        parts = day_arg_lower.split(None, 1)
+        month = _MONTH_NAMES.get(parts[0])
+        if month is None or len(parts) < 2:
+            return None
+        day_str, _ = _split_leading_digits(parts[1], 2)
+        if not day_str:
+            return None
+        return _past_date(today, month, int(day_str))
 
     # Handle "2025-12-02"
-    if re.match(r"\d{4}-\d{1,2}-\d{1,2}", day_arg):
-        return day_arg
+    year_str, rest = _split_leading_digits(day_arg, 4)
+    if len(year_str) == 4 and rest[:1] == "-":
+        month_str, rest = _split_leading_digits(rest[1:], 2)
+        if month_str and rest[:1] == "-" and _split_leading_digits(rest[1:], 2)[0]:
+            return day_arg
 
     # Handle "12/02" or "12-02"
-    short_match = re.match(r"(\d{1,2})[/-](\d{1,2})", day_arg)
-    if short_match:
-        month, day = map(int, short_match.groups())
-        try:
-            target_date = datetime.date(today.year, month, day)
-            if target_date > today:
-                target_date = datetime.date(today.year - 1, month, day)
-            return target_date.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+    month_str, rest = _split_leading_digits(day_arg, 2)
+    if month_str and rest[:1] in ("/", "-"):
+        day_str, _ = _split_leading_digits(rest[1:], 2)
+        if day_str:
+            return _past_date(today, int(month_str), int(day_str))
 
     return None
 
 
 def find_final_update_for_date(
-    messages: List[discord.Message], target_date: str
+    messages: List[discord.Message],
+    target_date: str,
+    texts: Optional[List[str]] = None,
+    lowered: Optional[List[str]] = None,
 ) -> Tuple[Optional[str], Optional[int]]:
-    """Find Final Update message for a specific date."""
+    """
+    Find Final Update message for a specific date.
+
+    texts/lowered may carry the already extracted (and lowercased) text of each message.
+    """
     # Extract month and day from target_date to allow year flexibility
     try:
-        target_dt = datetime.datetime.strptime(target_date, "%Y-%m-%d")
+        target_dt = _parse_ymd(target_date)
         target_month = target_dt.month
         target_day = target_dt.day
     except ValueError:
@@ -123,9 +223,13 @@ def find_final_update_for_date(
         target_month = None
         target_day = None
     
-    for idx, msg in enumerate(messages):
-        text = extract_message_text(msg)
-        if "task final update" not in text.lower():
+    if texts is None:
+        texts = [extract_message_text(msg) for msg in messages]
+    if lowered is None:
+        lowered = [text.lower() for text in texts]
+
+    for idx, text in enumerate(texts):
+        if "task final update" not in lowered[idx]:
             continue
         run_date = _extract_run_date_from_text(text)
         if run_date:
@@ -135,7 +239,7 @@ def find_final_update_for_date(
             # Flexible match: same month and day, any year
             if target_month and target_day:
                 try:
-                    run_dt = datetime.datetime.strptime(run_date, "%Y-%m-%d")
+                    run_dt = _parse_ymd(run_date)
                     if run_dt.month == target_month and run_dt.day == target_day:
                         logger.debug("Found date match (flexible): %s matches %s (month/day)", run_date, target_date)
                         return text, idx
@@ -183,47 +287,50 @@ def _extract_run_date_from_text(text: str) -> Optional[str]:
     Prefer the explicit Start Time date, but fall back to End Time when
     Start Time is missing (e.g., Method 9 runs that report `Start Time: null`).
     """
-    # Primary: Start Time
-    start_match = re.search(
-        r"start\s*time:\s*(\d{4}-\d{2}-\d{2})",
-        text,
-        re.IGNORECASE,
-    )
-    if start_match:
-        return start_match.group(1)
-
-    # Fallback: End Time (may include time component)
-    end_match = re.search(
-        r"end\s*time:\s*(\d{4}-\d{2}-\d{2})",
-        text,
-        re.IGNORECASE,
-    )
-    if end_match:
-        return end_match.group(1)
+    end_date: Optional[str] = None
+    for match in _RE_RUN_TIME.finditer(text):
+        # Primary: Start Time
+        if match.group("start"):
+            return match.group("date")
+        # Fallback: End Time (may include time component)
+        if end_date is None:
+            end_date = match.group("date")
+
+    return end_date
 
-    return None
+
+_part_timestamp = operator.itemgetter(0)
 
 
 def combine_final_update_messages(
     messages: List[discord.Message],
     primary_index: Optional[int],
     primary_text: str,
+    texts: Optional[List[str]] = None,
+    lowered: Optional[List[str]] = None,
 ) -> str:
     """
     Combine split Final Update messages (Discord may split large messages).
     messages list must be newest-first. We walk older messages and append
     any continuation that looks like Final Update/Method/Popup content.
+    Returns primary_text unchanged unless at least two parts (primary included)
+    qualify, so a primary that is not final-like itself is never dropped.
+    texts/lowered may carry the already extracted (and lowercased) text of each message.
     """
     if primary_index is None or primary_index < 0:
         return primary_text
 
-    primary_msg = messages[primary_index]
-    primary_ts = getattr(primary_msg, "created_at", None)
+    if texts is None:
+        texts = [extract_message_text(msg) for msg in messages]
+    if lowered is None:
+        lowered = [text.lower() for text in texts]
+
+    primary_ts = messages[primary_index].created_at
     run_date = _extract_run_date_from_text(primary_text)
     window_sec = 300  # 5 minutes; split parts share the same timestamp
     parts: List[Tuple[datetime.datetime, str]] = []
 
-    def is_final_like_text(text: str) -> bool:
+    def is_final_like_text(text_lower: str) -> bool:
         """
         Check if text is a FINAL update (not intermediate Task Update).
 
@@ -232,85 +339,100 @@ def combine_final_update_messages(
         - "Task Update" without "Final" (EXCLUDE - intermediate update)
         - Continuation sections with account data (INCLUDE - part of Final Update)
         """
-        tl = text.lower()
-
         # EXCLUDE intermediate "Task Update" messages (not Final)
         # These have "task update" but NOT "task final update"
-        if "task update" in tl and "task final update" not in tl:
+        if "task update" in text_lower and "task final update" not in text_lower:
             return False
 
         # Include actual Final Updates
-        if "task final update" in tl:
+        if "task final update" in text_lower:
             return True
 
         # Include popup/error messages that are final-like
-        if "request pending" in tl or "popup detected" in tl:
+        if "request pending" in text_lower or "popup detected" in text_lower:
             return True
 
         # Include Method 9 completions with account info
-        if "automation type" in tl and "method 9" in tl and "account username" in tl:
+        if "automation type" in text_lower and "method 9" in text_lower and "account username" in text_lower:
             return True
 
         # Include continuation sections that have account data
         # These are split parts of Final Updates that don't have the header
         # They have "automation type" AND "account username" AND final-update fields
         # like "no. of follow made" (not "this run follows made" which is intermediate)
-        if ("automation type" in tl and "account username" in tl and
-            ("no. of follow made" in tl or "no. of follow requests made" in tl or "no. of unfollowed" in tl)):
+        if ("automation type" in text_lower and "account username" in text_lower and
+            ("no. of follow made" in text_lower or "no. of follow requests made" in text_lower or "no. of unfollowed" in text_lower)):
             return True
 
         return False
 
+    def in_window(idx: int) -> bool:
+        msg_ts = messages[idx].created_at
+        if primary_ts and msg_ts:
+            return abs((primary_ts - msg_ts).total_seconds()) <= window_sec
+        return True
+
+    # Split parts share the primary's timestamp. Messages are newest-first, so
+    # walking away from the primary, the first one outside the window ends the run.
+    older = []  # index > primary_index
+    for i in range(primary_index + 1, len(messages)):
+        if not in_window(i):
+            break
+        older.append(i)
+    newer = []  # index < primary_index
+    for i in range(primary_index - 1, -1, -1):
+        if not in_window(i):
+            break
+        newer.append(i)
+    if not older and not newer:
+        return primary_text
+
     def consider(idx: int):
-        msg = messages[idx]
-        text = extract_message_text(msg)
-        if not text or not text.strip():
-            return
-        if not is_final_like_text(text):
+        if not is_final_like_text(lowered[idx]):
             return
-        msg_ts = getattr(msg, "created_at", None)
-        if primary_ts and msg_ts:
-            if abs((primary_ts - msg_ts).total_seconds()) > window_sec:
-                return
+        text = texts[idx]
         msg_date = _extract_run_date_from_text(text)
         if run_date and msg_date and msg_date != run_date:
             return
-        parts.append(
-            (msg_ts or datetime.datetime.min.replace(tzinfo=datetime.timezone.utc), text)
+        msg_ts = messages[idx].created_at
+        # Keep parts in timestamp order; equal timestamps stay in visit order
+        bisect.insort(
+            parts,
+            (msg_ts or datetime.datetime.min.replace(tzinfo=datetime.timezone.utc), text),
+            key=_part_timestamp,
         )
 
     # Include primary
     consider(primary_index)
-    # Older messages (index > primary_index)
-    for i in range(primary_index + 1, len(messages)):
+    # Older messages (index > primary_index), then newer ones in index order
+    for i in older:
         consider(i)
-    # Newer messages (index < primary_index)
-    for i in range(0, primary_index):
+    for i in reversed(newer):
         consider(i)
 
-    if len(parts) == 1:
+    if len(parts) <= 1:
         return primary_text
 
-    parts_sorted = sorted(parts, key=lambda p: p[0])
-    return "\n".join(p[1] for p in parts_sorted)
+    return "\n".join(text for _, text in parts)
 
 
 def split_schedule_and_final_update(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Split combined text into schedule and final update portions when both exist."""
 
-    text_lower = text.lower()
-
-    final_update_pos = text_lower.find("task final update")
-    if final_update_pos == -1:
+    final_update_match = _RE_TASK_FINAL.search(text)
+    if final_update_match is None:
         # No final update marker; treat as schedule only if it looks like schedule.
+        text_lower = text.lower()
         if "schedule" in text_lower or "weekly plan scheduled" in text_lower:
             return text, None
         return None, None
 
+    final_update_pos = final_update_match.start()
     schedule_part = text[:final_update_pos].strip()
     final_update_part = text[final_update_pos:].strip()
 
-    if "schedule" not in schedule_part.lower() and "weekly plan scheduled" not in schedule_part.lower():
+    schedule_lower = schedule_part.lower()
+    if "schedule" not in schedule_lower and "weekly plan scheduled" not in schedule_lower:
         schedule_part = None
 
     return schedule_part, final_update_part
@@ -329,49 +451,74 @@ def extract_schedule_and_final_update(
     final_update_text: Optional[str] = None
     reminder_text: Optional[str] = None
 
+    # Classify every message once (newest first); winners are picked below
+    # using the same precedence as the individual searches.
+    texts: List[str] = []
+    lowered: List[str] = []
+    final_index: Optional[int] = None
+    fallback_index: Optional[int] = None
+    part2_index: Optional[int] = None
+    reminder_indices: List[int] = []
+    schedule_indices: List[int] = []
+
+    for idx, msg in enumerate(messages):
+        text = extract_message_text(msg)
+        texts.append(text)
+        text_lower = text.lower()
+        lowered.append(text_lower)
+        if not text or not text.strip():
+            continue
+
+        has_final_marker = "task final update" in text_lower
+        has_account = "account username:" in text_lower or "account:" in text_lower
+        has_method = "automation type" in text_lower or "method 9" in text_lower
+        has_popup = "request pending" in text_lower or "popup detected" in text_lower
+        if final_index is None and has_final_marker and (has_account or has_method or has_popup):
+            final_index = idx
+
+        # Fallback: popup/method messages even if "Task Final Update" is missing
+        has_method9 = "method 9" in text_lower
+        has_stats = "stats" in text_lower or "automation type" in text_lower or "device name" in text_lower
+        if fallback_index is None and (has_popup or has_method9) and has_stats and has_account:
+            fallback_index = idx
+
+        is_daily_reminder = (
+            "daily schedule reminder" in text_lower
+            or ("start time:" in text_lower and "accounts:" in text_lower and "task:" in text_lower)
+        )
+        if is_daily_reminder:
+            reminder_indices.append(idx)
+
+        # Must look like a schedule (has day markers or Accounts: section)
+        has_schedule_markers = (
+            ("schedule" in text_lower and ("📅" in text or "accounts:" in text_lower))
+            or "weekly plan scheduled" in text_lower
+        )
+        if has_schedule_markers:
+            schedule_indices.append(idx)
+
+        if part2_index is None and "(part 2)" in text_lower and not has_final_marker:
+            part2_index = idx
+
     # STEP 1: Find the Final Update message
     final_update_index: Optional[int] = None
 
     if target_date:
         # Find Final Update for specific date
-        final_update_text, final_update_index = find_final_update_for_date(messages, target_date)
+        final_update_text, final_update_index = find_final_update_for_date(
+            messages, target_date, texts=texts, lowered=lowered
+        )
         if final_update_text:
             logger.debug("Found final update for target date %s", target_date)
-    else:
-        # Find most recent Final Update (existing code)
-        for idx, msg in enumerate(messages):  # newest first
-            text = extract_message_text(msg)
-            if not text or not text.strip():
-                continue
-            text_lower = text.lower()
-
-            has_final_marker = "task final update" in text_lower
-            has_account = "account username:" in text_lower or "account:" in text_lower
-            has_method = "automation type" in text_lower or "method 9" in text_lower
-            has_popup = "request pending" in text_lower or "popup detected" in text_lower
-
-            if has_final_marker and (has_account or has_method or has_popup):
-                final_update_text = text
-                final_update_index = idx
-                logger.debug("Found final update message: %d characters", len(final_update_text))
-                break
-
-        # Fallback: capture popup/method messages even if "Task Final Update" is missing
-        if not final_update_text:
-            for idx, msg in enumerate(messages):
-                text = extract_message_text(msg)
-                if not text or not text.strip():
-                    continue
-                text_lower = text.lower()
-                has_popup = "request pending" in text_lower or "popup detected" in text_lower
-                has_method9 = "method 9" in text_lower
-                has_stats = "stats" in text_lower or "automation type" in text_lower or "device name" in text_lower
-                has_account = "account username:" in text_lower or "account:" in text_lower
-                if (has_popup or has_method9) and has_stats and has_account:
-                    final_update_text = text
-                    final_update_index = idx
-                    logger.debug("Captured fallback final update (popup/method9) message: %d characters", len(final_update_text))
-                    break
+    elif final_index is not None:
+        # Most recent Final Update
+        final_update_index = final_index
+        final_update_text = texts[final_index]
+        logger.debug("Found final update message: %d characters", len(final_update_text))
+    elif fallback_index is not None:
+        final_update_index = fallback_index
+        final_update_text = texts[fallback_index]
+        logger.debug("Captured fallback final update (popup/method9) message: %d characters", len(final_update_text))
 
     # STEP 1b: If found, append any continuation parts (Discord splits long messages)
     if final_update_text and final_update_index is not None:
@@ -379,58 +526,44 @@ def extract_schedule_and_final_update(
             messages,
             primary_index=final_update_index,
             primary_text=final_update_text,
+            texts=texts,
+            lowered=lowered,
         )
 
     # STEP 2: Find the most recent Schedule message
-    for msg in messages:  # newest first
-        text = extract_message_text(msg)
-        if not text or not text.strip():
-            continue
-        text_lower = text.lower()
-
-        is_daily_reminder = (
-            "daily schedule reminder" in text_lower
-            or ("start time:" in text_lower and "accounts:" in text_lower and "task:" in text_lower)
-        )
-        if is_daily_reminder and reminder_text is None:
-            reminder_text = text
-            logger.debug("Captured daily reminder message: %d characters", len(reminder_text))
-
-        # Must look like a schedule (has day markers or Accounts: section)
-        has_schedule_markers = (
-            ("schedule" in text_lower and ("📅" in text or "accounts:" in text_lower))
-            or "weekly plan scheduled" in text_lower
-        )
-
-        if has_schedule_markers:
-            # If this message also contains the final update we found, split it
-            if final_update_text and text == final_update_text:
-                # Combined message - split at "Task Final Update"
-                match = re.search(r"task\s+final\s+update", text, re.IGNORECASE)
-                if match:
-                    schedule_text = text[:match.start()].strip()
-                    # final_update_text already set correctly above
-                    logger.debug("Split combined message: schedule=%d, final=%d", len(schedule_text), len(final_update_text))
-                    break
-            else:
-                # Separate message
-                schedule_text = text
-                logger.debug("Found separate schedule message: %d characters", len(schedule_text))
+    schedule_stop_index: Optional[int] = None
+    for idx in schedule_indices:  # newest first
+        text = texts[idx]
+        # If this message also contains the final update we found, split it
+        if final_update_text and idx == final_update_index:
+            # Combined message - split at "Task Final Update"
+            match = _RE_TASK_FINAL.search(text)
+            if match:
+                schedule_text = text[:match.start()].strip()
+                schedule_stop_index = idx
+                # final_update_text already set correctly above
+                logger.debug("Split combined message: schedule=%d, final=%d", len(schedule_text), len(final_update_text))
                 break
+        else:
+            # Separate message
+            schedule_text = text
+            schedule_stop_index = idx
+            logger.debug("Found separate schedule message: %d characters", len(schedule_text))
+            break
+
+    # The newest daily reminder at or before the chosen schedule message
+    for idx in reminder_indices:
+        if schedule_stop_index is not None and idx > schedule_stop_index:
+            break
+        reminder_text = texts[idx]
+        logger.debug("Captured daily reminder message: %d characters", len(reminder_text))
+        break
 
     # STEP 3: Handle Part 2 continuation for schedule
-    if schedule_text:
-        # Look for Part 2 message that continues the schedule
-        for msg in messages:
-            text = extract_message_text(msg)
-            if not text or not text.strip():
-                continue
-            text_lower = text.lower()
-            if "(part 2)" in text_lower and "task final update" not in text_lower:
-                # Append Part 2 to schedule
-                schedule_text = schedule_text + "\n" + text
-                logger.debug("Appended Part 2 to schedule, total length now %d", len(schedule_text))
-                break
+    if schedule_text and part2_index is not None:
+        # Append Part 2 to schedule
+        schedule_text = schedule_text + "\n" + texts[part2_index]
+        logger.debug("Appended Part 2 to schedule, total length now %d", len(schedule_text))
 
     # Prefer the single-day daily reminder over the multi-day schedule when present
     if reminder_text:
@@ -440,7 +573,7 @@ def extract_schedule_and_final_update(
     return schedule_text, final_update_text
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountData:
     username: str
     scheduled_follows: int  # 0 if Off
@@ -451,7 +584,21 @@ class AccountData:
     is_unfollow: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class ScheduledAccount:
+    status: str           # "Method 1", "Off", ...
+    planned_follows: int  # 0 if not given
+
+
+@dataclass(slots=True)
+class ActualAccount:
+    follows: int          # follows OR unfollows, depending on is_unfollow
+    requests: int
+    is_blocked: bool
+    is_unfollow: bool
+
+
+@dataclass(slots=True)
 class ChannelData:
     channel_name: str
     device_name: str
@@ -462,28 +609,46 @@ class ChannelData:
     error_message: Optional[str]
 
 
+def _split_day_sections(schedule_text: str) -> List[Tuple[str, str]]:
+    """Split a multi-day schedule into (day string, section content) pairs."""
+    anchors = list(_RE_DAY_ANCHOR.finditer(schedule_text))
+    if not anchors:
+        return []
+    # The last section runs to the end of the text, minus one trailing newline
+    text_end = len(schedule_text) - 1 if schedule_text.endswith("\n") else len(schedule_text)
+    ends = [m.start() for m in anchors[1:]]
+    ends.append(max(text_end, anchors[-1].end()))
+    return [
+        (m.group(1), schedule_text[m.end():end])
+        for m, end in zip(anchors, ends)
+    ]
+
+
+# How much of a final update parse_final_update probes for hard error notices
+_ERROR_PROBE_CHARS = 512
+
+# Stand-ins for accounts missing from the schedule or the final update
+_NO_SCHEDULE = ScheduledAccount("Unknown", 0)
+_NO_ACTUAL = ActualAccount(0, 0, False, False)
+
+
 def parse_schedule_for_date(
     schedule_text: str,
     run_date: Optional[str] = None,
-) -> Tuple[str, str, Dict[str, Tuple[str, int]]]:
+) -> Tuple[str, str, Dict[str, ScheduledAccount]]:
     """
     Parse schedule and match to specific run_date from Final Update.
 
-    Returns: (device_name, method, {username: (status, planned_follows)})
+    Returns: (device_name, method, {username: ScheduledAccount})
     """
     device_name = "Unknown"
     method = "Method 1"
-    accounts: Dict[str, Tuple[str, int]] = {}
+    accounts: Dict[str, ScheduledAccount] = {}
 
     lowered = schedule_text.lower()
 
     # Daily reminder block (single-day schedule) – prefer this over full weekly schedule
-    reminder_date_match = re.search(
-        r"start\s*time:\s*(\d{4}-\d{2}-\d{2})", schedule_text, re.IGNORECASE
-    )
-    reminder_task_match = re.search(r"task:\s*(.+?)(?:\n|$)", schedule_text, re.IGNORECASE)
-    if reminder_task_match:
-        device_name = normalize_device_name(reminder_task_match.group(1).strip())
+    reminder_date_match = _RE_START_TIME.search(schedule_text)
 
     section_to_parse = ""
     matched_day = None
@@ -500,21 +665,17 @@ def parse_schedule_for_date(
         logger.debug("Using Daily Schedule Reminder section for schedule parsing")
         section_to_parse = schedule_text
 
-    # Extract device name
-    device_match = re.search(
-        r"(?:weekly plan scheduled|task):\s*(.+?)(?:\n|$|\s{2,}|\s*📅)",
-        schedule_text,
-        re.IGNORECASE,
-    )
+    # Extract device name ("Weekly Plan Scheduled: X" or the reminder's "Task: X")
+    device_match = _RE_SCHEDULE_DEVICE.search(schedule_text)
     if device_match:
-        device_name = device_match.group(1).strip()
+        device_name = normalize_device_name(device_match.group(1).strip())
 
     # Convert run_date "2025-12-02" to day pattern like "Tue Dec 02" and "Dec 02"
     target_patterns = []
     target_day_num = None
     if run_date:
         try:
-            dt = datetime.datetime.strptime(run_date, "%Y-%m-%d")
+            dt = _parse_ymd(run_date)
             target_day_num = dt.day
             target_patterns = [
                 dt.strftime("%a %b %d"),      # "Tue Dec 02"
@@ -528,29 +689,26 @@ def parse_schedule_for_date(
 
     # Only look for multi-day schedule sections if we didn't already pick the reminder
     if not section_to_parse:
-        # Find day sections - handle multiple formats:
-        # Format 1: "📅 Tue Dec 02 18:22:" or "📅\nTue Dec 02 18:22:"
-        # Format 2: "Tue Dec 02 18:22:" (no emoji, from text extraction)
-        # Pattern captures: (day string like "Tue Dec 02"), (content until next day or end)
-        day_pattern = r"(?:📅\s*\n?\s*)?(\w{3}\s+\w{3}\s+\d{1,2})\s+[\d:]+\s*:(.*?)(?=(?:📅\s*\n?\s*)?\w{3}\s+\w{3}\s+\d{1,2}\s+[\d:]+\s*:|$)"
-
-        day_matches = re.findall(day_pattern, schedule_text, re.DOTALL | re.IGNORECASE)
+        # Find day sections (see _RE_DAY_ANCHOR for the supported formats)
+        day_matches = _split_day_sections(schedule_text)
 
         logger.debug("Found %d day sections in schedule", len(day_matches))
         for date_str, _ in day_matches:
             logger.debug("  Day section: %s", date_str.strip())
 
         if day_matches and target_patterns:
+            # Lowercase the patterns once (deduplicated, order kept for logging)
+            target_lc = tuple(dict.fromkeys(p.lower() for p in target_patterns))
             for date_str, section in day_matches:
-                date_str_clean = ' '.join(date_str.split()).strip()  # Normalize whitespace
+                date_str_clean = ' '.join(date_str.split())  # Normalize whitespace
+                date_lc = date_str_clean.lower()
 
                 # Check if any target pattern matches
-                for pattern in target_patterns:
-                    if pattern.lower() in date_str_clean.lower():
-                        section_to_parse = section
-                        matched_day = date_str_clean
-                        logger.debug("Matched schedule day: '%s' with pattern '%s'", date_str_clean, pattern)
-                        break
+                pattern = next((p for p in target_lc if p in date_lc), None)
+                if pattern is not None:
+                    section_to_parse = section
+                    matched_day = date_str_clean
+                    logger.debug("Matched schedule day: '%s' with pattern '%s'", date_str_clean, pattern)
 
                 if section_to_parse:
                     break
@@ -560,9 +718,7 @@ def parse_schedule_for_date(
 
     # Fallback: "Accounts:" section (daily reminder format)
     if not section_to_parse:
-        accounts_match = re.search(
-            r"Accounts:\s*(.*?)(?:$)", schedule_text, re.DOTALL | re.IGNORECASE
-        )
+        accounts_match = _RE_ACCOUNTS_SECTION.search(schedule_text)
         if accounts_match:
             section_to_parse = accounts_match.group(1)
             logger.debug("Using 'Accounts:' section fallback")
@@ -574,18 +730,19 @@ def parse_schedule_for_date(
         logger.warning("Using first day as fallback: %s", matched_day)
 
     # Parse account lines from the matched section
-    account_pattern = r"(\w+(?:\.\w+)?)\s*:\s*(Method\s*\d+|Off)(?:,\s*(\d+)\s*follows)?"
-
-    for match in re.finditer(account_pattern, section_to_parse, re.IGNORECASE):
-        username = match.group(1)
+    intern = sys.intern
+    skip_names = _SCHEDULE_SKIP_NAMES
+    for match in _RE_ACCOUNT_LINE.finditer(section_to_parse):
+        username, status, follows_str = match.groups()
 
-        # Skip garbage
-        if username.lower() in ["type", "method", "automation", "stats", "device", "notification"]:
+        # Skip garbage and non-ASCII names (see _USERNAME)
+        if username.lower() in skip_names or not username.isascii():
             continue
 
-        status = match.group(2)
-        follows = int(match.group(3)) if match.group(3) else 0
-        accounts[username] = (status, follows)
+        # Statuses repeat across every account and channel; share one object each
+        status = intern(status)
+        follows = int(follows_str) if follows_str else 0
+        accounts[username] = ScheduledAccount(status, follows)
 
         if "method" in status.lower():
             method = status
@@ -597,18 +754,26 @@ def parse_schedule_for_date(
 
 def parse_final_update(
     final_update_text: str,
-) -> Tuple[str, str, Dict[str, Tuple[int, int, bool, bool]], Optional[str]]:
+) -> Tuple[str, str, Dict[str, ActualAccount], Optional[str]]:
     """
     Parse Task Final Update text - keeps LAST occurrence of each account.
 
-    Returns: (device_name, run_date, {username: (follows, requests, is_blocked)}, error_message)
+    Returns: (device_name, run_date, {username: ActualAccount}, error_message)
     """
     device_name = "Unknown"
     run_date = ""
-    accounts: Dict[str, Tuple[int, int, bool, bool]] = {}
+    accounts: Dict[str, ActualAccount] = {}
     error_message: Optional[str] = None
 
-    lowered = final_update_text.lower()
+    if not final_update_text:
+        return device_name, run_date, accounts, error_message
+
+    # Hard error notices carry their marker near the top; probe the head first
+    head = final_update_text[:_ERROR_PROBE_CHARS].lower()
+    if "force stopped" in head:
+        return device_name, run_date, accounts, "Automation force stopped"
+
+    lowered = head if len(final_update_text) <= _ERROR_PROBE_CHARS else final_update_text.lower()
 
     # VALIDATION: Warn if we're parsing something that looks like an intermediate update
     if "task update" in lowered and "task final update" not in lowered:
@@ -628,9 +793,7 @@ def parse_final_update(
         popup_detected = "Request pending popup detected"
 
     # Extract device name (first occurrence)
-    device_match = re.search(
-        r"device name:\s*(.+?)(?:\n|$)", final_update_text, re.IGNORECASE
-    )
+    device_match = _RE_DEVICE_NAME.search(final_update_text)
     if device_match:
         device_name = device_match.group(1).strip()
 
@@ -638,41 +801,45 @@ def parse_final_update(
     run_date = _extract_run_date_from_text(final_update_text) or ""
 
     # DON'T split by "Task Final Update" - just parse ALL account sections
-    # Split by "---" separators across the ENTIRE text
-    sections = re.split(r"-{5,}", final_update_text)
-
-    for section in sections:
-        user_match = re.search(
-            r"account username:\s*(\w+(?:\.\w+)?)", section, re.IGNORECASE
-        )
-        if not user_match:
-            # Fallback for popup/error messages that use "Account:" instead of "Account Username:"
-            user_match = re.search(
-                r"account:\s*(\w+(?:\.\w+)?)", section, re.IGNORECASE
-            )
-        if not user_match:
+    # Sections are separated by "---" runs across the ENTIRE text; one scan
+    # collects the first occurrence of each field per section.
+    sections: List[Tuple[int, int, Dict[str, str]]] = []
+    fields: Dict[str, str] = {}
+    section_start = 0
+    for match in _RE_FINAL_FIELDS.finditer(final_update_text):
+        kind = match.lastgroup
+        if kind == "sep":
+            sections.append((section_start, match.start(), fields))
+            section_start = match.end()
+            fields = {}
+        elif kind not in fields:
+            fields[kind] = match.group(kind)
+    sections.append((section_start, len(final_update_text), fields))
+
+    # Checked once: the per-account log lines are skipped entirely when filtered out
+    log_debug = logger.isEnabledFor(logging.DEBUG)
+    log_info = logger.isEnabledFor(logging.INFO)
+    skip_names = _FINAL_UPDATE_SKIP_NAMES
+
+    for section_start, section_end, fields in sections:
+        # Fallback for popup/error messages that use "Account:" instead of "Account Username:"
+        username = fields.get("user") or fields.get("alt")
+        if not username:
             continue
 
-        username = user_match.group(1)
-
-        # Skip garbage usernames
-        if username.lower() in ["type", "method", "automation", "stats", "device", "name", "notification"]:
-            logger.debug("Skipping garbage username '%s' from final update", username)
+        # Skip garbage and non-ASCII usernames (see _USERNAME)
+        if username.lower() in skip_names or not username.isascii():
+            if log_debug:
+                logger.debug("Skipping garbage username '%s' from final update", username)
             continue
 
-        follows_match = re.search(
-            r"no\.\s*of\s*follow\s*made:\s*(\d+)", section, re.IGNORECASE
-        )
-        unfollow_match = re.search(
-            r"no\.\s*of\s*unfollowed\s*accounts:\s*(\d+)", section, re.IGNORECASE
-        )
         follows = 0
         is_unfollow_run = False
-        if unfollow_match:
-            follows = int(unfollow_match.group(1).replace(",", ""))
+        if "unfollows" in fields:
+            follows = int(fields["unfollows"])
             is_unfollow_run = True
-        elif follows_match:
-            follows = int(follows_match.group(1).replace(",", ""))
+        elif "follows" in fields:
+            follows = int(fields["follows"])
 
         if is_unfollow_run:
             # Unfollow runs should not add follow request counts; force zero
@@ -680,54 +847,51 @@ def parse_final_update(
         else:
             # CRITICAL: Only match "no. of follow requests MADE: X" (with "Made")
             # Do NOT match "no. of follow requests: username + N others" (that's a list of users, not a count!)
-            requests_match = re.search(
-                r"no\.\s*of\s*follow\s*requests\s*made:\s*(\d+)", section, re.IGNORECASE
-            )
-            if requests_match:
-                requests = int(requests_match.group(1).replace(",", ""))
+            if "requests" in fields:
+                requests = int(fields["requests"])
             else:
                 # VALIDATION: Check if there's a "N others" pattern that we're correctly ignoring
-                others_pattern = re.search(
-                    r"no\.\s*of\s*follow\s*requests:.*\+\s*(\d+)\s*others",
-                    section,
-                    re.IGNORECASE,
-                )
-                if others_pattern:
-                    logger.debug(
-                        "Correctly ignoring 'N others' pattern for %s (N=%s is a user list, not count)",
-                        username,
-                        others_pattern.group(1),
+                if log_debug:
+                    others_pattern = _RE_REQUESTS_FALLBACK.search(
+                        final_update_text, section_start, section_end
                     )
+                    if others_pattern:
+                        logger.debug(
+                            "Correctly ignoring 'N others' pattern for %s (N=%s is a user list, not count)",
+                            username,
+                            others_pattern.group(1),
+                        )
                 requests = 0
 
-        blocked_match = re.search(
-            r"account actions blocked:\s*(true|false)", section, re.IGNORECASE
-        )
-        is_blocked = blocked_match and blocked_match.group(1).lower() == "true"
+        blocked = fields.get("blocked")
+        is_blocked = blocked and blocked.lower() == "true"
 
         # FIX: ALWAYS overwrite - keep LAST value (from Task Final Update, not Task Update)
-        if username in accounts:
-            old_follows, old_requests, _, _ = accounts[username]
-            logger.info(
-                f"Overwriting account {username}: was {old_follows}+{old_requests}, now {follows}+{requests}"
-            )
+        if log_info:
+            old = accounts.get(username)
+            if old is not None:
+                logger.info(
+                    "Overwriting account %s: was %s+%s, now %s+%s",
+                    username, old.follows, old.requests, follows, requests,
+                )
 
-        accounts[username] = (follows, requests, is_blocked, is_unfollow_run)
+        accounts[username] = ActualAccount(follows, requests, is_blocked, is_unfollow_run)
 
-        logger.info(
-            f"Parsed account {username}: follows={follows}, requests={requests}, "
-            f"blocked={is_blocked} (total={follows + requests})"
-        )
+        if log_info:
+            logger.info(
+                "Parsed account %s: follows=%s, requests=%s, blocked=%s (total=%s)",
+                username, follows, requests, is_blocked, follows + requests,
+            )
 
     # If we detected the popup and didn't capture an account (or any data), set an error message.
     if popup_detected:
         error_message = popup_detected
         if not accounts:
-            popup_account_match = re.search(
-                r"account:\s*(\w+(?:\.\w+)?)", final_update_text, re.IGNORECASE
-            )
+            popup_account_match = _RE_ACCOUNT_ALT.search(final_update_text)
             popup_account = popup_account_match.group(1) if popup_account_match else "unknown"
-            accounts[popup_account] = (0, 0, False, False)
+            if not popup_account.isascii():
+                popup_account = "unknown"
+            accounts[popup_account] = ActualAccount(0, 0, False, False)
 
     return device_name, run_date, accounts, error_message
 
@@ -736,12 +900,24 @@ def normalize_device_name(name: str) -> str:
     """Normalize device name to 'Phone X' format."""
     if not name or name == "Unknown":
         return name
-    match = re.search(r"phone\s*(\d+)", name, re.IGNORECASE)
+    match = _RE_PHONE_NORMALIZE.search(name)
     if match:
-        return f"Phone {match.group(1)}"
+        return sys.intern(f"Phone {match.group(1)}")
     return name
 
 
+def _merge_account(username: str, sched: ScheduledAccount, actual: ActualAccount) -> AccountData:
+    return AccountData(
+        username=username,
+        scheduled_follows=sched.planned_follows,
+        scheduled_status=sched.status,
+        actual_follows=actual.follows,
+        actual_requests=actual.requests,
+        is_blocked=actual.is_blocked,
+        is_unfollow=actual.is_unfollow,
+    )
+
+
 def build_channel_data(
     channel_name: str,
     schedule_text: Optional[str],
@@ -750,13 +926,12 @@ def build_channel_data(
 ) -> ChannelData:
     """Combine schedule and final update – matching by date."""
 
-    accounts: List[AccountData] = []
     device_name = "Unknown"
     method = "Method 1"
     error_message: Optional[str] = None
 
     # Extract expected phone number from channel name
-    channel_phone_match = re.search(r"phone-?(\d+)", channel_name, re.IGNORECASE)
+    channel_phone_match = _RE_CHANNEL_PHONE.search(channel_name)
     expected_phone_num = channel_phone_match.group(1) if channel_phone_match else None
 
     # Track method from Final Update so schedule parsing cannot override it
@@ -764,7 +939,7 @@ def build_channel_data(
 
     # Parse Final Update FIRST to get run_date
     run_date: Optional[str] = None
-    actual_accounts: Dict[str, Tuple[int, int, bool, bool]] = {}
+    actual_accounts: Dict[str, ActualAccount] = {}
     if final_update_text:
         fu_device, run_date, actual_accounts, error_message = parse_final_update(
             final_update_text
@@ -773,14 +948,14 @@ def build_channel_data(
             device_name = normalize_device_name(fu_device)
         logger.debug("Channel %s: Final update run_date=%s, accounts=%s", channel_name, run_date, list(actual_accounts.keys()))
         # Prefer method from Final Update when present
-        method_match = re.search(r"automation type:\s*(method\s*\d+)", final_update_text, re.IGNORECASE)
+        method_match = _RE_AUTOMATION_TYPE.search(final_update_text)
         if method_match:
             method_from_final = f"Method {method_match.group(1).strip().split()[-1]}"
         elif "method 9" in final_update_text.lower():
             method_from_final = "Method 9"
 
     # Parse Schedule using run_date to match the correct day
-    scheduled_accounts: Dict[str, Tuple[str, int]] = {}
+    scheduled_accounts: Dict[str, ScheduledAccount] = {}
     if schedule_text:
         sched_device, method, scheduled_accounts = parse_schedule_for_date(
             schedule_text, run_date
@@ -794,11 +969,11 @@ def build_channel_data(
         method = method_from_final
 
     # VALIDATION: Check for mismatches (schedule says "Off" but account actually ran)
-    for username, (actual_follows, actual_requests, _, _) in actual_accounts.items():
-        if username in scheduled_accounts:
-            sched_status, sched_follows = scheduled_accounts[username]
-            total_actual = actual_follows + actual_requests
-            if sched_status.lower() == "off" and total_actual > 0:
+    for username, actual in actual_accounts.items():
+        sched = scheduled_accounts.get(username)
+        if sched is not None:
+            total_actual = actual.follows + actual.requests
+            if sched.status.lower() == "off" and total_actual > 0:
                 logger.error(
                     "DATE MISMATCH for %s/%s: Schedule says 'Off' but actual=%d. "
                     "run_date=%s, schedule may have matched wrong day!",
@@ -807,8 +982,8 @@ def build_channel_data(
 
     # If Final Update device doesn't match channel, prefer channel name
     if expected_phone_num and device_name != "Unknown":
-        device_num_match = re.search(r"(\d+)", device_name)
-        if device_num_match and device_num_match.group(1) != expected_phone_num:
+        device_num = _first_digit_run(device_name)
+        if device_num and device_num != expected_phone_num:
             logger.warning(
                 "Device mismatch: channel=%s but Final Update says %s. Using channel-based name.",
                 channel_name, device_name
@@ -827,47 +1002,46 @@ def build_channel_data(
             # Normalize whatever we have
             device_name = normalize_device_name(device_name)
 
-    # Merge account data, preferring actual_accounts where available
-    all_usernames = set(scheduled_accounts.keys()) | set(actual_accounts.keys())
-
-    for username in all_usernames:
-        sched_status, sched_follows = scheduled_accounts.get(
-            username, ("Unknown", 0)
-        )
-        actual_follows, actual_requests, is_blocked, is_unfollow = actual_accounts.get(
-            username, (0, 0, False, False)
-        )
-
+    # Merge account data, preferring actual_accounts where available.
+    # Scheduled accounts keep schedule order; accounts only in the final update follow.
+    accounts_by_name: Dict[str, AccountData] = {
+        username: _merge_account(username, sched, _NO_ACTUAL)
+        for username, sched in scheduled_accounts.items()
+    }
+    log_debug = logger.isEnabledFor(logging.DEBUG)
+    for username, actual in actual_accounts.items():
+        row = accounts_by_name.get(username)
+        if row is None:
+            accounts_by_name[username] = _merge_account(username, _NO_SCHEDULE, actual)
+            continue
         # Debug logging for schedule merging
-        if username in actual_accounts and username in scheduled_accounts:
+        if log_debug:
             logger.debug(
                 "Merged %s: schedule=%s/%d, actual=%d+%d",
-                username, sched_status, sched_follows, actual_follows, actual_requests
-            )
-
-        accounts.append(
-            AccountData(
-                username=username,
-                scheduled_follows=sched_follows,
-                scheduled_status=sched_status,
-                actual_follows=actual_follows,
-                actual_requests=actual_requests,
-                is_blocked=is_blocked,
-                is_unfollow=is_unfollow,
+                username, row.scheduled_status, row.scheduled_follows, actual.follows, actual.requests
             )
-        )
+        row.actual_follows = actual.follows
+        row.actual_requests = actual.requests
+        row.is_blocked = actual.is_blocked
+        row.is_unfollow = actual.is_unfollow
+    accounts: List[AccountData] = list(accounts_by_name.values())
 
     return ChannelData(
         channel_name=channel_name,
         device_name=device_name,
         method=method,
         accounts=accounts,
-        has_schedule=bool(schedule_text) and bool(scheduled_accounts),
+        has_schedule=bool(schedule_text and scheduled_accounts),
         has_final_update=bool(final_update_text),
         error_message=error_message,
     )
 
 
+# Prebound formatters for format_channels_compact's per-account and per-channel fields
+_COMPACT_ACCOUNT_FMT = "{}:{}:{}:{}+{}:{}".format
+_COMPACT_LINE_FMT = "{}|{}|{}".format
+
+
 def format_channels_compact(channels: List[ChannelData]) -> str:
     """
     Format channel data into minimal text for AI.
@@ -876,6 +1050,7 @@ def format_channels_compact(channels: List[ChannelData]) -> str:
     device_name|status|account1:scheduled_status:scheduled:actual+requests:blocked,account2:...
     """
     lines: List[str] = []
+    append = lines.append
 
     for ch in channels:
         if ch.error_message:
@@ -888,100 +1063,117 @@ def format_channels_compact(channels: List[ChannelData]) -> str:
         else:
             status = f"ok:{ch.method}"
 
-        acc_parts: List[str] = []
-        for a in ch.accounts:
-            blocked_flag = "y" if a.is_blocked else "n"
-            # FIX: Send actual_follows+actual_requests, NOT total+requests
-            acc_parts.append(
-                f"{a.username}:{a.scheduled_status}:{a.scheduled_follows}:"
-                f"{a.actual_follows}+{a.actual_requests}:{blocked_flag}"
+        # FIX: Send actual_follows+actual_requests, NOT total+requests
+        accounts_str = ",".join([
+            _COMPACT_ACCOUNT_FMT(
+                a.username, a.scheduled_status, a.scheduled_follows,
+                a.actual_follows, a.actual_requests, "y" if a.is_blocked else "n",
             )
-
-        accounts_str = ",".join(acc_parts)
-        lines.append(f"{ch.device_name}|{status}|{accounts_str}")
+            for a in ch.accounts
+        ])
+        append(_COMPACT_LINE_FMT(ch.device_name, status, accounts_str))
 
     return "\n".join(lines)
 
 
+def _account_line_template(
+    blocked: bool, ran: bool, no_target: bool, met: bool, is_off: bool, is_m9: bool
+) -> str:
+    """Pick the account line shape for one combination of the per-account flags."""
+    # FIX: Check actual data FIRST, not schedule status
+    # If account actually ran (has follows/requests), show results regardless of schedule
+    if ran or blocked:
+        if blocked:
+            return "   * {username} – blocked"
+        if no_target:
+            # No schedule info, just show total
+            return "   * {username} - total # of {action} made: {total}"
+        if met:
+            return "   * {username} - total # of {action} made: {total} (met the daily max which is {target})"
+        return "   * {username} - total # of {action} made: {total} (didn't met the daily max which is {target})"
+    if is_off:
+        # Schedule says off AND no actual data
+        return "   * {username} – off"
+    if is_m9:
+        # Method 9 - no stats shown
+        return "   * {username}"
+    # Schedule says should run but didn't (0 follows)
+    if not no_target:
+        return "   * {username} - total # of follows made: 0 (didn't met the daily max which is {target})"
+    return "   * {username} - total # of follows made: 0"
+
+
+# Every flag combination resolved once, so formatting an account is a single lookup
+_ACCOUNT_LINE_TEMPLATES: Dict[Tuple[bool, ...], Callable[..., str]] = {
+    flags: _account_line_template(*flags).format
+    for flags in itertools.product((False, True), repeat=6)
+}
+
+
+def _format_account_line(acc: AccountData) -> str:
+    """Format one account line of a non-Method 9 channel."""
+    if acc.is_unfollow:
+        total = acc.actual_follows  # unfollows count
+        action_word = "unfollows"
+    else:
+        total = acc.actual_follows + acc.actual_requests
+        action_word = "follows"
+
+    target = acc.scheduled_follows
+    status = acc.scheduled_status
+    template = _ACCOUNT_LINE_TEMPLATES[(
+        bool(acc.is_blocked), total > 0, target == 0, total >= target,
+        status == "Off", status == "Method 9",
+    )]
+    return template(username=acc.username, action=action_word, total=total, target=target)
+
+
 def format_output_directly(channels: List[ChannelData]) -> str:
     """Format output - prioritize actual results over schedule."""
     lines: List[str] = []
+    append = lines.append
+    extend = lines.extend
 
     for ch in channels:
+        method = ch.method
+        is_m9 = method == "Method 9"
+        accounts = ch.accounts
+        device = ch.device_name
+
         # Phone line
         if ch.error_message:
-            lines.append(f"{ch.device_name} – Error: {ch.error_message}")
-        elif not ch.has_final_update:
-            if ch.method == "Method 9" and ch.accounts:
-                lines.append(f"{ch.device_name} – completed daily task ({ch.method})")
-            else:
-                lines.append(f"{ch.device_name} – no daily task made")
+            phone_line = f"{device} – Error: {ch.error_message}"
+        elif ch.has_final_update or (is_m9 and accounts):
+            phone_line = f"{device} – completed daily task ({method})"
         else:
-            lines.append(f"{ch.device_name} – completed daily task ({ch.method})")
-
-        # Account lines - filter out empty/invalid accounts and ensure consistent formatting
-        for acc in ch.accounts:
-            # Skip accounts with empty or invalid usernames
-            if not acc.username or not acc.username.strip():
-                continue
-
-            # Method 9: never show follow stats; only show blocked or username
-            if ch.method == "Method 9":
-                if acc.is_blocked:
-                    lines.append(f"   * {acc.username} – blocked")
-                else:
-                    lines.append(f"   * {acc.username}")
-                continue
-
-            if acc.is_unfollow:
-                total = acc.actual_follows  # unfollows count
-                action_word = "unfollows"
-            else:
-                total = acc.actual_follows + acc.actual_requests
-                action_word = "follows"
-
-            # FIX: Check actual data FIRST, not schedule status
-            # If account actually ran (has follows/requests), show results regardless of schedule
-            if total > 0 or acc.is_blocked:
-                # Account actually ran - show results regardless of schedule
-                if acc.is_blocked:
-                    lines.append(f"   * {acc.username} – blocked")
-                elif acc.scheduled_follows == 0:
-                    # No schedule info, just show total
-                    lines.append(f"   * {acc.username} - total # of {action_word} made: {total}")
-                elif total >= acc.scheduled_follows:
-                    lines.append(
-                        f"   * {acc.username} - total # of {action_word} made: {total} "
-                        f"(met the daily max which is {acc.scheduled_follows})"
-                    )
-                else:
-                    lines.append(
-                        f"   * {acc.username} - total # of {action_word} made: {total} "
-                        f"(didn't met the daily max which is {acc.scheduled_follows})"
-                    )
-            elif acc.scheduled_status == "Off":
-                # Schedule says off AND no actual data
-                lines.append(f"   * {acc.username} – off")
-            elif acc.scheduled_status == "Method 9":
-                # Method 9 - no stats shown
-                lines.append(f"   * {acc.username}")
-            else:
-                # Schedule says should run but didn't (0 follows)
-                if acc.scheduled_follows > 0:
-                    lines.append(
-                        f"   * {acc.username} - total # of follows made: 0 "
-                        f"(didn't met the daily max which is {acc.scheduled_follows})"
-                    )
-                else:
-                    lines.append(f"   * {acc.username} - total # of follows made: 0")
+            phone_line = f"{device} – no daily task made"
+        append(phone_line)
+
+        # Skip accounts with empty or invalid usernames
+        # Method 9: never show follow stats; only show blocked or username
+        if is_m9:
+            extend([
+                f"   * {acc.username} – blocked" if acc.is_blocked else f"   * {acc.username}"
+                for acc in accounts
+                if acc.username and acc.username.strip()
+            ])
+        else:
+            extend([
+                _format_account_line(acc)
+                for acc in accounts
+                if acc.username and acc.username.strip()
+            ])
 
-    # Filter out any empty lines and join
-    filtered_lines = [line for line in lines if line.strip()]
-    return "\n".join(filtered_lines)
+    # Every phone and account line above is non-empty, so no filtering pass is needed
+    return "\n".join(lines)
 
 
 @bot.event
 async def on_ready():
+    global _phone_channels
+    # A fresh READY rebuilds the guild's channel objects, and channels may have
+    # changed while disconnected, so the cached list is rebuilt below
+    _phone_channels = None
     logger.info("Summary bot logged in as %s (ID: %s)", bot.user, bot.user.id)
     logger.info(
         "Using server_id=%s owner_user_ids=%s timezone=%s keywords=%s",
@@ -991,97 +1183,354 @@ async def on_ready():
         settings.keywords,
     )
     init_gemini(settings)
+    guild = bot.get_guild(settings.server_id)
+    if guild is not None:
+        _get_phone_channels(guild)
+    # Resolve owners up front so summary delivery does not wait on REST lookups
+    for owner_id in settings.owner_user_ids:
+        try:
+            await _get_owner(owner_id)
+        except discord.HTTPException as exc:
+            logger.warning("Could not resolve owner %s: %s", owner_id, exc)
     # Auto daily summary disabled; use !summary command to trigger manually.
 
 
-async def run_daily_summary(
-    target_date: Optional[str] = None,
-    destination: Optional[Messageable] = None,
-):
-    """Run summary for a specific date or most recent."""
-    guild: Optional[discord.Guild] = bot.get_guild(settings.server_id)
-    if guild is None:
-        logger.error("Guild with ID %s not found", settings.server_id)
+# Newest-first copy of each phone channel's recent history, kept current by the
+# gateway listeners below so summary runs do not refetch it over REST. A channel
+# is cached after its first full fetch; anything that could leave a gap (edits,
+# deletions, a dropped gateway connection) discards the copy and the next run
+# fetches the history again.
+_HISTORY_LIMIT = 200
+# Phone channels whose history is fetched at the same time (stays well inside
+# Discord's global rate limit)
+_HISTORY_FETCH_CONCURRENCY = 8
+# Days of history before a requested day that can still hold its schedule
+_HISTORY_LOOKBACK_DAYS = 8
+_history_cache: Dict[int, Deque[discord.Message]] = {}
+# Full history fetches in flight; concurrent runs for the same channel await
+# the same task instead of reading a half-filled copy
+_history_fetches: Dict[int, "asyncio.Task[List[discord.Message]]"] = {}
+# Messages that arrived while a channel's full fetch was in flight (oldest
+# first). Invalidating the channel drops its entry, so that fetch is not cached.
+_history_arrivals: Dict[int, List[discord.Message]] = {}
+
+
+@bot.listen("on_message")
+async def _cache_new_message(message: discord.Message):
+    cached = _history_cache.get(message.channel.id)
+    if cached is not None:
+        cached.appendleft(message)
         return
+    arrivals = _history_arrivals.get(message.channel.id)
+    if arrivals is not None:
+        arrivals.append(message)
 
-    me = guild.me
-    logger.info("Running daily summary for guild '%s' (%s), target_date=%s", guild.name, guild.id, target_date)
 
-    channel_structs: List[ChannelData] = []
+def _drop_history(channel_id: int) -> None:
+    _history_cache.pop(channel_id, None)
+    _history_arrivals.pop(channel_id, None)
 
-    for channel in guild.text_channels:
-        logger.info("Checking channel #%s (%s)", channel.name, channel.id)
 
-        # Skip test channels
-        if "test" in channel.name.lower():
-            logger.info("Skipping test channel #%s", channel.name)
-            continue
+@bot.listen("on_raw_message_edit")
+async def _drop_history_on_edit(payload: discord.RawMessageUpdateEvent):
+    _drop_history(payload.channel_id)
 
-        # Only consider phone channels like #phone-1, #phone-6, etc.
-        if not channel.name.startswith("phone-"):
-            continue
 
-        perms = channel.permissions_for(me)
-        if not (perms.read_messages and perms.read_message_history):
-            logger.info(
-                "Skipping #%s (%s): missing read permissions",
-                channel.name,
-                channel.id,
-            )
-            continue
+@bot.listen("on_raw_message_delete")
+async def _drop_history_on_delete(payload: discord.RawMessageDeleteEvent):
+    _drop_history(payload.channel_id)
 
-        history_messages: List[discord.Message] = []
-        try:
-            async for message in channel.history(limit=200, oldest_first=False):
-                history_messages.append(message)
-        except (discord.Forbidden, discord.HTTPException):
-            logger.info(
-                "Skipping #%s (%s): failed to fetch message history",
-                channel.name,
-                channel.id,
-            )
-            continue
 
-        if not history_messages:
-            continue
+@bot.listen("on_raw_bulk_message_delete")
+async def _drop_history_on_bulk_delete(payload: discord.RawBulkMessageDeleteEvent):
+    _drop_history(payload.channel_id)
 
-        # Use combined extraction to handle schedule and final update in same or separate messages
-        schedule_text, final_update_text = extract_schedule_and_final_update(
-            history_messages,
-            target_date=target_date,
-        )
 
-        if not schedule_text and not final_update_text:
-            # Not a phone schedule/final pair
-            logger.info(
-                "Skipping #%s (%s): no schedule/final update content found",
-                channel.name,
-                channel.id,
-            )
-            continue
+@bot.listen("on_disconnect")
+async def _drop_history_on_disconnect():
+    _history_cache.clear()
+    _history_arrivals.clear()
+
+
+def _history_cutoff(target_date: Optional[str]) -> Optional[datetime.datetime]:
+    """
+    Oldest message time that can matter for target_date, or None to read everything.
+
+    A weekly plan is posted up to a week before the day it covers, so keep
+    _HISTORY_LOOKBACK_DAYS of history before the target day. The most recent
+    summary (no target_date) may rely on arbitrarily old messages.
+    """
+    if not target_date:
+        return None
+    try:
+        target_dt = _parse_ymd(target_date)
+    except ValueError:
+        return None
+    return target_dt.replace(tzinfo=datetime.timezone.utc) - datetime.timedelta(days=_HISTORY_LOOKBACK_DAYS)
+
+
+def _is_before(message: discord.Message, cutoff: Optional[datetime.datetime]) -> bool:
+    return cutoff is not None and message.created_at is not None and message.created_at < cutoff
+
+
+def _recent_messages(
+    messages: Iterable[discord.Message],
+    cutoff: Optional[datetime.datetime],
+) -> List[discord.Message]:
+    """The leading (newest-first) messages that are not older than cutoff."""
+    recent = []
+    for message in messages:
+        if _is_before(message, cutoff):
+            break
+        recent.append(message)
+    return recent
+
+
+async def _fetch_recent_history(
+    channel: discord.TextChannel,
+    cutoff: Optional[datetime.datetime] = None,
+) -> List[discord.Message]:
+    """
+    Newest-first recent messages of a channel, from the history cache when warm.
+
+    Messages older than cutoff are left out; the history is newest-first, so
+    reading stops at the first one and skips the remaining REST pages.
+    Raises discord.Forbidden / discord.HTTPException when the fetch fails.
+    """
+    cached = _history_cache.get(channel.id)
+    if cached is not None:
+        return _recent_messages(cached, cutoff)
+
+    fetch = _history_fetches.get(channel.id)
+    if fetch is None:
+        if cutoff is not None:
+            # A partial read can't seed the cache; a later full read will
+            history_messages = []
+            async for message in channel.history(limit=_HISTORY_LIMIT, oldest_first=False):
+                if _is_before(message, cutoff):
+                    break
+                history_messages.append(message)
+            return history_messages
+        fetch = _history_fetches[channel.id] = asyncio.ensure_future(_fetch_full_history(channel))
+    # Shielded: one caller being cancelled must not cancel the shared fetch
+    return _recent_messages(await asyncio.shield(fetch), cutoff)
+
 
+async def _fetch_full_history(channel: discord.TextChannel) -> List[discord.Message]:
+    """
+    Read a channel's full recent history (newest first) and cache it, unless
+    the channel was invalidated while the read was in flight.
+    """
+    # Register first so messages arriving mid-fetch are collected, not lost
+    arrivals: List[discord.Message] = []
+    _history_arrivals[channel.id] = arrivals
+    try:
+        history_messages = [
+            message async for message in channel.history(limit=_HISTORY_LIMIT, oldest_first=False)
+        ]
+    finally:
+        # A failed fetch leaves nothing behind, so the next run retries it
+        del _history_fetches[channel.id]
+        intact = _history_arrivals.get(channel.id) is arrivals
+        if intact:
+            del _history_arrivals[channel.id]
+
+    newest_id = history_messages[0].id if history_messages else 0
+    arrived = [message for message in reversed(arrivals) if message.id > newest_id]
+    if arrived:
+        history_messages = (arrived + history_messages)[:_HISTORY_LIMIT]
+    # Only publish the copy, fully filled, if nothing invalidated it meanwhile
+    if intact:
+        _history_cache[channel.id] = deque(history_messages, maxlen=_HISTORY_LIMIT)
+    return history_messages
+
+
+async def _collect_channel(
+    channel: discord.TextChannel,
+    me: discord.Member,
+    target_date: Optional[str],
+    fetch_slots: asyncio.Semaphore,
+) -> Optional[ChannelData]:
+    """Fetch one phone channel's history and parse it, or None when it has nothing to report."""
+    perms = channel.permissions_for(me)
+    if not (perms.read_messages and perms.read_message_history):
         logger.info(
-            "Channel #%s schedule length=%s, final length=%s",
+            "Skipping #%s (%s): missing read permissions",
             channel.name,
-            len(schedule_text) if schedule_text else 0,
-            len(final_update_text) if final_update_text else 0,
+            channel.id,
         )
+        return None
 
-        channel_data = build_channel_data(
-            channel_name=channel.name,
-            schedule_text=schedule_text,
-            final_update_text=final_update_text,
-            target_date=target_date,
+    try:
+        async with fetch_slots:
+            history_messages = await _fetch_recent_history(channel, _history_cutoff(target_date))
+    except (discord.Forbidden, discord.HTTPException):
+        logger.info(
+            "Skipping #%s (%s): failed to fetch message history",
+            channel.name,
+            channel.id,
         )
+        return None
+
+    if not history_messages:
+        return None
+
+    # Use combined extraction to handle schedule and final update in same or separate messages
+    schedule_text, final_update_text = extract_schedule_and_final_update(
+        history_messages,
+        target_date=target_date,
+    )
 
+    if not schedule_text and not final_update_text:
+        # Not a phone schedule/final pair
         logger.info(
-            "Parsed channel %s -> device=%s, accounts=%d",
+            "Skipping #%s (%s): no schedule/final update content found",
             channel.name,
-            channel_data.device_name,
-            len(channel_data.accounts),
+            channel.id,
         )
+        return None
+
+    logger.info(
+        "Channel #%s schedule length=%s, final length=%s",
+        channel.name,
+        len(schedule_text) if schedule_text else 0,
+        len(final_update_text) if final_update_text else 0,
+    )
+
+    channel_data = build_channel_data(
+        channel_name=channel.name,
+        schedule_text=schedule_text,
+        final_update_text=final_update_text,
+        target_date=target_date,
+    )
+
+    logger.info(
+        "Parsed channel %s -> device=%s, accounts=%d",
+        channel.name,
+        channel_data.device_name,
+        len(channel_data.accounts),
+    )
+
+    return channel_data
+
+
+# Phone channels of the summary guild in channel order, built on first use and
+# dropped on READY, when the bot joins/leaves the guild and whenever a channel
+# is created, renamed/moved or deleted
+_phone_channels: Optional[List[discord.TextChannel]] = None
+
+
+def _get_phone_channels(guild: discord.Guild) -> List[discord.TextChannel]:
+    global _phone_channels
+    if _phone_channels is None:
+        # Only consider phone channels like #phone-1, #phone-6, etc. (never test channels)
+        _phone_channels = [
+            channel for channel in guild.text_channels if _RE_PHONE_CHANNEL.match(channel.name)
+        ]
+        logger.info("Found %d phone channels in guild '%s'", len(_phone_channels), guild.name)
+    return _phone_channels
+
+
+def _drop_phone_channels(guild: discord.Guild) -> None:
+    global _phone_channels
+    if guild.id == settings.server_id:
+        _phone_channels = None
+
+
+@bot.listen("on_guild_channel_create")
+async def _phone_channel_created(channel: GuildChannel):
+    _drop_phone_channels(channel.guild)
+
+
+@bot.listen("on_guild_channel_delete")
+async def _phone_channel_deleted(channel: GuildChannel):
+    _drop_phone_channels(channel.guild)
+
+
+@bot.listen("on_guild_channel_update")
+async def _phone_channel_updated(before: GuildChannel, after: GuildChannel):
+    _drop_phone_channels(after.guild)
+
+
+@bot.listen("on_guild_join")
+async def _phone_guild_joined(guild: discord.Guild):
+    _drop_phone_channels(guild)
+
+
+@bot.listen("on_guild_remove")
+async def _phone_guild_removed(guild: discord.Guild):
+    _drop_phone_channels(guild)
+
+
+# Owners resolved so far; users rarely change, so each is fetched over REST once
+_owner_users: Dict[int, discord.User] = {}
 
-        channel_structs.append(channel_data)
+
+async def _get_owner(owner_id: int) -> discord.User:
+    owner = _owner_users.get(owner_id) or bot.get_user(owner_id)
+    if owner is None:
+        owner = await bot.fetch_user(owner_id)
+    _owner_users[owner_id] = owner
+    return owner
+
+
+def _iter_chunks(text: str, size: int = 1900) -> Iterator[str]:
+    """
+    Yield text in Discord-sized pieces (the message limit is 2000 characters).
+
+    Pieces break at line boundaries so no account line is cut in half; only a
+    single line longer than size is split mid-line. Blank pieces are skipped
+    because Discord rejects empty messages.
+    """
+    lines: List[str] = []
+    length = 0
+    for line in text.split("\n"):
+        if lines and length + 1 + len(line) > size:
+            chunk = "\n".join(lines)
+            if chunk.strip():
+                yield chunk
+            lines = []
+            length = 0
+        while len(line) > size:
+            yield line[:size]
+            line = line[size:]
+        length += len(line) + 1 if lines else len(line)
+        lines.append(line)
+    chunk = "\n".join(lines)
+    if chunk.strip():
+        yield chunk
+
+
+async def run_daily_summary(
+    target_date: Optional[str] = None,
+    destination: Optional[Messageable] = None,
+):
+    """Run summary for a specific date or most recent."""
+    guild: Optional[discord.Guild] = bot.get_guild(settings.server_id)
+    if guild is None:
+        logger.error("Guild with ID %s not found", settings.server_id)
+        return
+
+    me = guild.me
+    logger.info("Running daily summary for guild '%s' (%s), target_date=%s", guild.name, guild.id, target_date)
+
+    channel_structs: List[ChannelData] = []
+
+    phone_channels = _get_phone_channels(guild)
+    for channel in phone_channels:
+        logger.info("Checking channel #%s (%s)", channel.name, channel.id)
+
+    # Channels are independent; fetch and parse them concurrently (results keep channel order)
+    fetch_slots = asyncio.Semaphore(_HISTORY_FETCH_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_collect_channel(channel, me, target_date, fetch_slots) for channel in phone_channels),
+        return_exceptions=True,
+    )
+    for channel, result in zip(phone_channels, results):
+        if isinstance(result, BaseException):
+            logger.error("Failed to process #%s (%s)", channel.name, channel.id, exc_info=result)
+        elif result is not None:
+            channel_structs.append(result)
 
     logger.info("Parsed %d channels into structured data", len(channel_structs))
 
@@ -1089,22 +1538,24 @@ async def run_daily_summary(
         logger.info("No channels with schedule/final data found; skipping summary.")
         return
 
-    # Use direct Python formatting (no AI - guaranteed correct formatting)
-    output_text = format_output_directly(channel_structs)
-    logger.info("Formatted output directly (no AI) - %d lines", len(output_text.split('\n')))
-    logger.debug("First 500 chars of output:\n%s", output_text[:500])
+    output_text = ""
+    if settings.use_gemini:
+        # Gemini path: only build the compact AI input when it is enabled
+        compact_data = format_channels_compact(channel_structs)
+        logger.info("Compact data size: %d characters", len(compact_data))
+        try:
+            output_text = await summarize_with_gemini(settings=settings, compact_data=compact_data) or ""
+        except Exception as exc:
+            logger.exception("Gemini failed: %s", exc)
 
-    # Alternative: Use Gemini (currently disabled - uncomment to enable)
-    # compact_data = format_channels_compact(channel_structs)
-    # logger.info("Compact data size: %d characters", len(compact_data))
-    # try:
-    #     output_text = await summarize_with_gemini(settings=settings, compact_data=compact_data)
-    # except Exception as exc:
-    #     logger.exception("Gemini failed: %s", exc)
-    #     output_text = format_output_directly(channel_structs)  # Fallback
+    if not output_text:
+        # Use direct Python formatting (no AI - guaranteed correct formatting)
+        output_text = format_output_directly(channel_structs)
+        logger.info("Formatted output directly (no AI) - %d lines", output_text.count('\n') + 1)
+    logger.debug("First 500 chars of output:\n%s", output_text[:500])
 
     if target_date:
-        dt = datetime.datetime.strptime(target_date, "%Y-%m-%d")
+        dt = _parse_ymd(target_date)
         today_str = dt.strftime("%B %d, %Y")
     else:
         today_str = datetime.datetime.now().strftime("%B %d, %Y")
@@ -1126,16 +1577,8 @@ async def run_daily_summary(
             
             logger.debug("Wrote summary bot output to %s (%d characters)", data_file, len(output_text.strip()))
             
-            # Extract date for analyzer report
-            date_str = None
-            if target_date:
-                dt = datetime.datetime.strptime(target_date, "%Y-%m-%d")
-                date_str = dt.strftime("%B %d, %Y")
-            else:
-                date_str = today_str
-            
-            # Get analyzer report from data.txt file
-            analyzer_report = analyze_from_file(data_file, date_str=date_str)
+            # Get analyzer report from data.txt file (same date heading as the summary)
+            analyzer_report = analyze_from_file(data_file, date_str=today_str)
             
             if analyzer_report:
                 logger.info("Successfully generated analyzer report (%d characters)", len(analyzer_report))
@@ -1155,12 +1598,10 @@ async def run_daily_summary(
     else:
         final_report = summary_bot_output
 
-    chunks = [final_report[i:i + 1900] for i in range(0, len(final_report), 1900)]
-
     # Preferred: send to the provided destination (e.g., the channel where the command ran)
     if destination:
         try:
-            for chunk in chunks:
+            for chunk in _iter_chunks(final_report):
                 await destination.send(chunk)
             return
         except Exception as exc:
@@ -1171,14 +1612,18 @@ async def run_daily_summary(
         logger.info("No owners configured; skipping DM delivery of summary.")
         return
 
-    for owner_id in settings.owner_user_ids:
+    async def dm_owner(owner_id: int):
         try:
-            owner = await bot.fetch_user(owner_id)
-            for chunk in chunks:
+            owner = await _get_owner(owner_id)
+            # Chunks go out one at a time so they arrive in order
+            for chunk in _iter_chunks(final_report):
                 await owner.send(chunk)
         except Exception as exc:
             logger.exception("Failed to DM owner %s with summary: %s", owner_id, exc)
 
+    # Each owner has their own DM channel, so owners are served concurrently
+    await asyncio.gather(*(dm_owner(owner_id) for owner_id in settings.owner_user_ids))
+
 
 @tasks.loop(hours=24)
 async def daily_summary():
@@ -1255,7 +1700,7 @@ async def summary_command(ctx: commands.Context, *, day_arg: str = None):
             )
             return
 
-        dt = datetime.datetime.strptime(target_date, "%Y-%m-%d")
+        dt = _parse_ymd(target_date)
         readable = dt.strftime("%A, %B %d, %Y")
         await ctx.send(f"📅 Getting summary for **{readable}**...")
     else: